@@ -4,18 +4,21 @@ FastAPI endpoints for contact management.
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from typing import List, Optional
 import logging
+import os
 from datetime import datetime, date
 import time
 from dotenv import load_dotenv
 from pathlib import Path
 
-# Load environment variables from .env file
+# Load environment variables from .env file (local development only; deployed
+# environments set CONTACTS_ENV and get them from the orchestrator)
 # Use explicit path to ensure .env is found regardless of working directory
 env_path = Path(__file__).parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
+if os.getenv("CONTACTS_ENV", "dev") == "dev":
+    load_dotenv(dotenv_path=env_path)
 
 from contacts.notion_client import NotionContactClient
 from contacts.models import (
@@ -31,7 +34,9 @@ from contacts.message_storage import MessageStorage
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
-app = FastAPI(title="Contact Management API", version="1.0.0")
+# FastAPI still converts responses to JSON-compatible data (datetimes become strings)
+# first; orjson only replaces the stdlib json.dumps of that final result
+app = FastAPI(title="Contact Management API", version="1.0.0", default_response_class=ORJSONResponse)
 
 # CORS middleware for frontend
 app.add_middleware(
@@ -282,7 +287,7 @@ async def get_contacts(
         if contacts is None:
             logger.info("Fetching contacts from Notion...")
             client = get_notion_client()
-            notion_contacts = client.get_all_contacts()
+            notion_contacts = await client.aget_all_contacts()
             logger.info(f"Fetched {len(notion_contacts)} contacts from Notion")
             
             # Merge with cached contacts using conflict resolution
@@ -316,7 +321,7 @@ async def get_contact(contact_id: str):
     """Get a single contact by ID."""
     try:
         client = get_notion_client()
-        contact = client.get_contact(contact_id)
+        contact = client.get_contact(contact_id, use_cache=True)
         
         if not contact:
             raise HTTPException(status_code=404, detail="Contact not found")
@@ -765,7 +770,7 @@ async def sync_email():
             }
         
         # Get responses to CRM-sent emails across all accounts
-        gmail_messages = gmail_manager.get_crm_responses(
+        gmail_messages = await gmail_manager.aget_crm_responses(
             thread_ids=crm_thread_ids,
             max_results=100
         )
@@ -816,7 +821,7 @@ async def sync_email():
                 from_email = from_email.strip()
                 
                 # Get all contacts and find by email
-                contacts = notion_client.get_all_contacts()
+                contacts = notion_client.get_all_contacts(incremental=True)
                 contact = None
                 for c in contacts:
                     if c.get("email") and c["email"].lower() == from_email.lower():
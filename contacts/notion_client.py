@@ -3,16 +3,255 @@ Notion API Client for Contact Management
 
 Handles all interactions with Notion database for contacts.
 """
+import asyncio
 import os
-from typing import Optional, List, Dict, Any
+import re
+from typing import Optional, List, Dict, Any, Iterator, Callable, Tuple
 from datetime import datetime, date
-from notion_client import Client
-from notion_client.errors import APIResponseError
+import httpx
+from notion_client import Client, AsyncClient
+from notion_client.errors import APIResponseError, HTTPResponseError, RequestTimeoutError
 import logging
+import random
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Leading whitespace, or any trailing run of whitespace/closing parentheses
+_CLEAN_RE = re.compile(r"^\s+|[\s)]+$")
+
+# Upper bound on memoized case-insensitive property name lookups
+_RESOLVED_NAMES_MAXSIZE = 1024
+
+# Candidate property names read by _map_notion_to_contact (keep in sync with it).
+# Query results are restricted to these via filter_properties.
+_CONTACT_PROPERTY_KEYS = [
+    ["Contact", "Name", "name"],
+    ["Email", "email"],
+    ["Phone", "phone"],
+    ["Status", "status"],
+    ["Type", "type"],
+    ["Group", "group"],
+    ["Relationship Type", "relationship_type", "Relationship type"],
+    ["Role", "role", "Title", "title"],
+    ["Company", "company"],
+    ["Industry", "industry"],
+    ["Location", "location"],
+    ["Linkedin", "LinkedIn URL", "linkedin_url", "LinkedIn url", "LinkedIn"],
+    ["Last contact date", "Last Contact Date", "last_contact_date"],
+    ["Days", "Days at current status", "Days At Current Status", "days_at_current_status"],
+    ["Count", "Call Count", "call_count"],
+    ["Notes", "notes"],
+    ["Created date", "Created Date", "created_date"],
+    ["Next followup date", "Next Followup Date", "next_followup_date"],
+    ["Followup context", "Followup Context", "followup_context"],
+]
+
+# Worker threads used by the batch create/update methods
+BATCH_MAX_WORKERS = 8
+
+# Seconds a fetched database schema is reused before being retrieved again
+SCHEMA_TTL = 300
+
+# Single-contact read cache (get_contact with use_cache=True): LRU size and TTL in seconds
+CONTACT_CACHE_MAXSIZE = 512
+CONTACT_TTL = 30
+
+# Retry backoff for transient Notion errors: full jitter over base * 2**attempt, capped
+BASE_DELAY = 1.0
+MAX_DELAY = 30.0
+
+
+# (date, ISO string) memo for _today_iso
+_today_cache: Optional[Tuple[date, str]] = None
+
+
+def _today_iso() -> str:
+    """Today's date as an ISO string, re-formatted only when the date changes."""
+    global _today_cache
+    today = date.today()
+    cached = _today_cache
+    if cached is None or cached[0] != today:
+        cached = (today, today.isoformat())
+        _today_cache = cached
+    return cached[1]
+
+
+# Notion's documented average rate limit is 3 requests per second per integration
+NOTION_RATE_LIMIT = 3.0
+# Seconds the request rate is halved for after a 429
+RATE_LIMIT_COOLDOWN = 10.0
+
+
+class _TokenBucket:
+    """Thread-safe token bucket shared by every Notion request in the process."""
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._penalty_until = 0.0
+        self._lock = threading.Lock()
+    
+    def reserve(self, n: int = 1) -> float:
+        """Take n tokens and return how many seconds the caller must wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            rate = self.rate / 2 if now < self._penalty_until else self.rate
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            # Tokens may go negative; later callers queue up behind the debt
+            self._tokens -= n
+            return -self._tokens / rate if self._tokens < 0 else 0.0
+    
+    def acquire(self, n: int = 1):
+        """Block until n tokens are available."""
+        wait_time = self.reserve(n)
+        if wait_time > 0:
+            time.sleep(wait_time)
+    
+    def penalize(self, cooldown: float = RATE_LIMIT_COOLDOWN):
+        """Halve the refill rate for the next `cooldown` seconds (after a 429)."""
+        with self._lock:
+            self._penalty_until = time.monotonic() + cooldown
+
+
+_notion_bucket = _TokenBucket(rate=NOTION_RATE_LIMIT, capacity=3)
+
+
+def _is_retryable(error: Exception, idempotent: bool = True) -> bool:
+    """
+    Whether a failed Notion call is worth retrying.
+    
+    Rate limiting is always retryable since Notion rejected the request before
+    doing any work. Timeouts, connection errors and 5xx responses are only
+    retried for idempotent calls, since the request may have been applied.
+    Auth/validation/not-found errors are never retried.
+    """
+    if isinstance(error, HTTPResponseError):
+        if error.status == 429:
+            return True
+        return idempotent and error.status >= 500
+    if isinstance(error, (RequestTimeoutError, httpx.TransportError)):
+        return idempotent
+    return False
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Parse the Retry-After header (in seconds) from a Notion error response, if any."""
+    headers = getattr(error, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+# Property value extractors, keyed by the prop_type passed to _get_property_value
+
+
+def _extract_title(prop: Dict) -> str:
+    title_array = prop.get("title", [])
+    return title_array[0].get("plain_text", "") if title_array else ""
+
+
+def _extract_rich_text(prop: Dict) -> str:
+    rich_text_array = prop.get("rich_text", [])
+    return rich_text_array[0].get("plain_text", "") if rich_text_array else ""
+
+
+def _extract_rich_text_link(prop: Dict) -> Optional[str]:
+    """Extract URL from rich_text that contains a link."""
+    rich_text_array = prop.get("rich_text", [])
+    if rich_text_array:
+        # Check if the first element has a link
+        first_element = rich_text_array[0]
+        # Notion rich_text links are in text.link.href structure
+        if "text" in first_element and "link" in first_element["text"]:
+            return first_element["text"]["link"].get("url")
+        # Also check direct href (some variations)
+        if "href" in first_element:
+            return first_element["href"]
+    return None
+
+
+def _extract_email(prop: Dict) -> Optional[str]:
+    return prop.get("email")
+
+
+def _extract_phone_number(prop: Dict) -> Optional[str]:
+    return prop.get("phone_number")
+
+
+def _extract_url(prop: Dict) -> Optional[str]:
+    url_value = prop.get("url")
+    # If URL property is empty, try to get from rich_text as fallback
+    if not url_value:
+        return _extract_rich_text_link(prop) or url_value
+    return url_value
+
+
+def _extract_select(prop: Dict) -> Optional[str]:
+    select_obj = prop.get("select")
+    return select_obj.get("name") if select_obj else None
+
+
+def _extract_status(prop: Dict) -> Optional[str]:
+    # Notion status type (similar to select but different structure)
+    status_obj = prop.get("status")
+    return status_obj.get("name") if status_obj else None
+
+
+def _extract_formula(prop: Dict) -> Any:
+    # Notion formula type - extract the result
+    formula_obj = prop.get("formula")
+    if formula_obj:
+        # Formula can return different types (number, string, date, etc.)
+        if "number" in formula_obj:
+            return formula_obj["number"]
+        elif "string" in formula_obj:
+            return formula_obj["string"]
+        elif "date" in formula_obj:
+            date_obj = formula_obj["date"]
+            return date_obj.get("start") if date_obj else None
+    return None
+
+
+def _extract_date(prop: Dict) -> Optional[str]:
+    date_obj = prop.get("date")
+    if date_obj and date_obj.get("start"):
+        return date_obj["start"]
+    return None
+
+
+def _extract_number(prop: Dict) -> Any:
+    return prop.get("number")
+
+
+def _extract_checkbox(prop: Dict) -> bool:
+    return prop.get("checkbox", False)
+
+
+_EXTRACTORS: Dict[str, Callable[[Dict], Any]] = {
+    "title": _extract_title,
+    "rich_text": _extract_rich_text,
+    "rich_text_url": _extract_rich_text_link,
+    "email": _extract_email,
+    "phone_number": _extract_phone_number,
+    "url": _extract_url,
+    "select": _extract_select,
+    "status": _extract_status,
+    "formula": _extract_formula,
+    "date": _extract_date,
+    "number": _extract_number,
+    "checkbox": _extract_checkbox,
+}
+
 
 class NotionContactClient:
     """Client for managing contacts in Notion database."""
@@ -33,11 +272,81 @@ class NotionContactClient:
         if not self.database_id:
             raise ValueError("Notion database ID is required. Set NOTION_DATABASE_ID environment variable.")
         
-        # Initialize client with timeout settings
+        # Initialize client with timeout settings, on a pooled keep-alive HTTP/2
+        # transport so only the first request pays for the TLS handshake
         self.client = Client(
             auth=self.api_key,
-            timeout_ms=30000  # 30 second timeout for API calls
+            timeout_ms=30000,  # 30 second timeout for API calls
+            client=httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=30)
+            )
         )
+        # LRU of contact_id -> (monotonic fetch time, contact), see get_contact
+        self._contact_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._contact_cache_lock = threading.Lock()
+        # Single background thread that prefetches the next page in iter_contacts
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notion-prefetch")
+        # Rate limiter shared with every other client in the process
+        self._bucket = _notion_bucket
+        # Async client is created lazily on first use (see _get_async_client)
+        self._async_client: Optional[AsyncClient] = None
+        # Memoized case-insensitive property name lookups (see _find_property_key)
+        self._resolved_names: Dict[tuple, Optional[str]] = {}
+        # Snapshot of the last fetched contacts (id -> contact) and the newest
+        # last_edited_time seen, used by incremental syncs
+        self._snapshot: Optional[Dict[str, Dict[str, Any]]] = None
+        self._high_water_mark: Optional[str] = None
+        # Notion property IDs read by the mapper, resolved from the schema on first fetch
+        self._wanted_property_ids: Optional[List[str]] = None
+        # (monotonic fetch time, database properties) - see _get_schema
+        self._schema_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Serializes forced schema refreshes after create validation errors
+        self._schema_refresh_lock = threading.Lock()
+    
+    def close(self):
+        """Close the prefetch thread and the underlying HTTP connection pools."""
+        self._executor.shutdown(wait=False)
+        self.client.close()
+        
+        if self._async_client is not None:
+            async_client, self._async_client = self._async_client, None
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            try:
+                if loop is not None:
+                    # Called from async code: schedule the close on the running loop
+                    loop.create_task(async_client.aclose())
+                else:
+                    asyncio.run(async_client.aclose())
+            except Exception as e:
+                logger.warning("Error closing async Notion client: %s", e)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _get_async_client(self) -> AsyncClient:
+        """
+        Get or create the async Notion client.
+        
+        Uses an HTTP/2 transport with keep-alive so paginated queries are
+        multiplexed over a single connection instead of re-handshaking.
+        """
+        if self._async_client is None:
+            self._async_client = AsyncClient(
+                auth=self.api_key,
+                timeout_ms=30000,
+                client=httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60)
+                )
+            )
+        return self._async_client
     
     def _get_linkedin_url(self, properties: Dict) -> Optional[str]:
         """
@@ -54,16 +363,16 @@ class NotionContactClient:
         prop = properties[actual_key]
         prop_type = prop.get("type")
         
-        logger.debug(f"Found LinkedIn URL property '{actual_key}' with type '{prop_type}'")
+        logger.debug("Found LinkedIn URL property '%s' with type '%s'", actual_key, prop_type)
         
         # Handle URL property type (most common for external links)
         if prop_type == "url":
             url_value = prop.get("url")
             if url_value:
-                logger.debug(f"Extracted LinkedIn URL from url property: {url_value}")
+                logger.debug("Extracted LinkedIn URL from url property: %s", url_value)
                 return url_value
             else:
-                logger.debug(f"URL property exists but is empty/null")
+                logger.debug("URL property exists but is empty/null")
         
         # Handle rich_text property (text properties show up as rich_text in API)
         if prop_type == "rich_text":
@@ -78,13 +387,13 @@ class NotionContactClient:
                         if "link" in text_obj and text_obj["link"]:
                             link_url = text_obj["link"].get("url")
                             if link_url:
-                                logger.debug(f"Extracted LinkedIn URL from rich_text link: {link_url}")
+                                logger.debug("Extracted LinkedIn URL from rich_text link: %s", link_url)
                                 return link_url
                         # Also check for href directly (some variations)
                         if "href" in text_obj:
                             href_url = text_obj["href"]
                             if href_url:
-                                logger.debug(f"Extracted LinkedIn URL from rich_text href: {href_url}")
+                                logger.debug("Extracted LinkedIn URL from rich_text href: %s", href_url)
                                 return href_url
                     
                     # Collect plain_text from all elements
@@ -97,22 +406,22 @@ class NotionContactClient:
                     full_text = full_text.strip()
                     # Check if it looks like a URL
                     if full_text.startswith("http://") or full_text.startswith("https://"):
-                        logger.debug(f"Extracted LinkedIn URL from rich_text plain_text: {full_text}")
+                        logger.debug("Extracted LinkedIn URL from rich_text plain_text: %s", full_text)
                         return full_text
                     # Check if it contains linkedin.com
                     if "linkedin.com" in full_text.lower():
                         # If it doesn't start with http, add https://
                         if not full_text.startswith("http"):
                             full_text = "https://" + full_text
-                        logger.debug(f"Extracted and normalized LinkedIn URL from rich_text: {full_text}")
+                        logger.debug("Extracted and normalized LinkedIn URL from rich_text: %s", full_text)
                         return full_text
                     # If it's just plain text that might be a URL, return it anyway
                     # (user might have pasted just the domain)
                     if full_text and len(full_text) > 5:  # Basic sanity check
-                        logger.debug(f"Returning plain text as potential URL: {full_text}")
+                        logger.debug("Returning plain text as potential URL: %s", full_text)
                         return full_text
             else:
-                logger.debug(f"rich_text property exists but is empty")
+                logger.debug("rich_text property exists but is empty")
         
         # Try using _get_property_value with rich_text type (for text properties)
         try:
@@ -121,20 +430,20 @@ class NotionContactClient:
                 text_value = text_value.strip()
                 # Check if it looks like a URL
                 if text_value.startswith("http://") or text_value.startswith("https://"):
-                    logger.debug(f"Extracted LinkedIn URL via _get_property_value (rich_text): {text_value}")
+                    logger.debug("Extracted LinkedIn URL via _get_property_value (rich_text): %s", text_value)
                     return text_value
                 # Check if it contains linkedin.com
                 if "linkedin.com" in text_value.lower():
                     if not text_value.startswith("http"):
                         text_value = "https://" + text_value
-                    logger.debug(f"Extracted and normalized LinkedIn URL via _get_property_value: {text_value}")
+                    logger.debug("Extracted and normalized LinkedIn URL via _get_property_value: %s", text_value)
                     return text_value
                 # Return the text value anyway if it exists
                 if text_value:
-                    logger.debug(f"Returning text value as potential URL: {text_value}")
+                    logger.debug("Returning text value as potential URL: %s", text_value)
                     return text_value
         except Exception as e:
-            logger.debug(f"Error in _get_property_value (rich_text) fallback: {e}")
+            logger.debug("Error in _get_property_value (rich_text) fallback: %s", e)
         
         # Handle formula property (if it's a formula that returns a URL)
         if prop_type == "formula":
@@ -144,20 +453,20 @@ class NotionContactClient:
                 if "string" in formula_obj:
                     url_value = formula_obj["string"]
                     if url_value and ("linkedin.com" in url_value.lower() or url_value.startswith("http")):
-                        logger.debug(f"Extracted LinkedIn URL from formula: {url_value}")
+                        logger.debug("Extracted LinkedIn URL from formula: %s", url_value)
                         return url_value
         
         # Try using _get_property_value as fallback (handles url type)
         try:
             url_value = self._get_property_value(properties, [actual_key], "url")
             if url_value:
-                logger.debug(f"Extracted LinkedIn URL via _get_property_value fallback: {url_value}")
+                logger.debug("Extracted LinkedIn URL via _get_property_value fallback: %s", url_value)
                 return url_value
         except Exception as e:
-            logger.debug(f"Error in _get_property_value fallback: {e}")
+            logger.debug("Error in _get_property_value fallback: %s", e)
         
         # Log the full property structure for debugging
-        logger.debug(f"Could not extract LinkedIn URL. Property structure: {prop}")
+        logger.debug("Could not extract LinkedIn URL. Property structure: %s", prop)
         
         return None
     
@@ -170,7 +479,7 @@ class NotionContactClient:
         if not group_value:
             return None
         # Strip trailing parentheses and whitespace
-        cleaned = group_value.strip().rstrip(')').strip()
+        cleaned = _CLEAN_RE.sub("", group_value)
         if not cleaned:
             return None
         
@@ -265,18 +574,29 @@ class NotionContactClient:
         Find a property key in Notion properties, trying multiple variations.
         Handles case-insensitive matching and different naming conventions.
         """
-        # First try exact matches
+        # First try exact matches (the common case)
         for key in possible_keys:
             if key in properties:
                 return key
         
+        # Cold path: pages from the same database share property names, so the
+        # case-insensitive result is memoized per (candidate keys, property names)
+        cache_key = (tuple(possible_keys), tuple(properties))
+        if cache_key in self._resolved_names:
+            return self._resolved_names[cache_key]
+        
         # Then try case-insensitive matches
+        resolved = None
         properties_lower = {k.lower(): k for k in properties.keys()}
         for key in possible_keys:
             if key.lower() in properties_lower:
-                return properties_lower[key.lower()]
+                resolved = properties_lower[key.lower()]
+                break
         
-        return None
+        if len(self._resolved_names) >= _RESOLVED_NAMES_MAXSIZE:
+            self._resolved_names.clear()
+        self._resolved_names[cache_key] = resolved
+        return resolved
     
     def _map_notion_to_contact(self, notion_page: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -342,6 +662,11 @@ class NotionContactClient:
                     if len(parts) > 1:
                         last_name = " ".join(parts[1:])
         
+        # Notion number properties can be null (and may come back as floats)
+        call_count = self._get_property_value(properties, ["Count", "Call Count", "call_count"], "number")
+        if call_count is None:
+            call_count = 0
+        
         # Get last_edited_time from Notion page metadata
         last_edited_time = None
         if "last_edited_time" in notion_page:
@@ -365,7 +690,7 @@ class NotionContactClient:
             "linkedin_url": self._get_linkedin_url(properties),
             "last_contact_date": self._get_property_value(properties, ["Last contact date", "Last Contact Date", "last_contact_date"], "date"),
             "days_at_current_status": self._get_property_value(properties, ["Days", "Days at current status", "Days At Current Status", "days_at_current_status"], "formula"),  # Your Days is a formula
-            "call_count": self._get_property_value(properties, ["Count", "Call Count", "call_count"], "number") or 0,
+            "call_count": call_count,
             "notes": self._get_property_value(properties, ["Notes", "notes"], "rich_text"),
             "created_date": self._get_property_value(properties, ["Created date", "Created Date", "created_date"], "date"),
             "next_followup_date": self._get_property_value(properties, ["Next followup date", "Next Followup Date", "next_followup_date"], "date"),
@@ -395,77 +720,14 @@ class NotionContactClient:
         
         prop = properties[actual_key]
         
+        extractor = _EXTRACTORS.get(prop_type)
+        if extractor is None:
+            return None
+        
         try:
-            if prop_type == "title":
-                title_array = prop.get("title", [])
-                return title_array[0].get("plain_text", "") if title_array else ""
-            elif prop_type == "rich_text":
-                rich_text_array = prop.get("rich_text", [])
-                return rich_text_array[0].get("plain_text", "") if rich_text_array else ""
-            elif prop_type == "rich_text_url":
-                # Extract URL from rich_text that contains a link
-                rich_text_array = prop.get("rich_text", [])
-                if rich_text_array:
-                    # Check if the first element has a link
-                    first_element = rich_text_array[0]
-                    # Notion rich_text links are in text.link.href structure
-                    if "text" in first_element and "link" in first_element["text"]:
-                        return first_element["text"]["link"].get("url")
-                    # Also check direct href (some variations)
-                    if "href" in first_element:
-                        return first_element["href"]
-                return None
-            elif prop_type == "email":
-                return prop.get("email")
-            elif prop_type == "phone_number":
-                return prop.get("phone_number")
-            elif prop_type == "url":
-                url_value = prop.get("url")
-                # If URL property is empty, try to get from rich_text as fallback
-                if not url_value:
-                    rich_text_array = prop.get("rich_text", [])
-                    if rich_text_array:
-                        first_element = rich_text_array[0]
-                        # Notion rich_text links are in text.link.href structure
-                        if "text" in first_element and "link" in first_element["text"]:
-                            return first_element["text"]["link"].get("url")
-                        # Also check direct href (some variations)
-                        if "href" in first_element:
-                            return first_element["href"]
-                return url_value
-            elif prop_type == "select":
-                select_obj = prop.get("select")
-                return select_obj.get("name") if select_obj else None
-            elif prop_type == "status":
-                # Notion status type (similar to select but different structure)
-                status_obj = prop.get("status")
-                return status_obj.get("name") if status_obj else None
-            elif prop_type == "formula":
-                # Notion formula type - extract the result
-                formula_obj = prop.get("formula")
-                if formula_obj:
-                    # Formula can return different types (number, string, date, etc.)
-                    if "number" in formula_obj:
-                        return formula_obj["number"]
-                    elif "string" in formula_obj:
-                        return formula_obj["string"]
-                    elif "date" in formula_obj:
-                        date_obj = formula_obj["date"]
-                        return date_obj.get("start") if date_obj else None
-                return None
-            elif prop_type == "date":
-                date_obj = prop.get("date")
-                if date_obj and date_obj.get("start"):
-                    return date_obj["start"]
-                return None
-            elif prop_type == "number":
-                return prop.get("number")
-            elif prop_type == "checkbox":
-                return prop.get("checkbox", False)
-            else:
-                return None
+            return extractor(prop)
         except (KeyError, IndexError, AttributeError) as e:
-            logger.warning(f"Error extracting {actual_key} ({prop_type}): {e}")
+            logger.warning("Error extracting %s (%s): %s", actual_key, prop_type, e)
             return None
     
     def _get_notion_property_name(self, properties: Dict, possible_names: List[str]) -> str:
@@ -548,7 +810,7 @@ class NotionContactClient:
             ("linkedin_url", ["Linkedin", "LinkedIn URL", "linkedin_url", "LinkedIn"], lambda v: {"rich_text": [{"text": {"content": str(v)}}]}),  # Changed to rich_text
             ("notes", ["Notes", "notes"], lambda v: {"rich_text": [{"text": {"content": str(v)}}]}),
             ("followup_context", ["Followup context", "followup_context"], lambda v: {"rich_text": [{"text": {"content": str(v)}}]}),
-            ("call_count", ["Count", "Call Count", "call_count"], lambda v: {"number": int(v)} if v is not None else None),
+            ("call_count", ["Count", "Call Count", "call_count"], lambda v: {"number": v if type(v) is int else int(v)}),  # Loop below already skips None
             # Note: "Days" is a formula in your database, so we can't write to it directly
             # ("days_at_current_status", ["Days", "Days at current status"], ...) - skipped, formula is read-only
         ]
@@ -592,108 +854,358 @@ class NotionContactClient:
         
         return properties
     
-    def get_all_contacts(self, page_size: int = 100, max_retries: int = 3) -> List[Dict[str, Any]]:
+    def _with_retry(self, func: Callable, *args, max_retries: int = 3, idempotent: bool = True, **kwargs) -> Any:
+        """
+        Call a Notion SDK method, retrying transient failures with exponential backoff.
+        
+        Args:
+            func: SDK method to call (e.g. self.client.pages.retrieve)
+            max_retries: Maximum number of attempts
+            idempotent: Whether timeouts/5xx may be retried (False for creates)
+        """
+        for attempt in range(max_retries):
+            self._bucket.acquire()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                wait_time = self._retry_wait(e, attempt, max_retries, idempotent)
+                if wait_time is None:
+                    raise
+                time.sleep(wait_time)
+    
+    async def _awith_retry(self, func: Callable, *args, max_retries: int = 3, idempotent: bool = True, **kwargs) -> Any:
+        """Async counterpart of _with_retry for AsyncClient methods."""
+        for attempt in range(max_retries):
+            await asyncio.sleep(self._bucket.reserve())
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                wait_time = self._retry_wait(e, attempt, max_retries, idempotent)
+                if wait_time is None:
+                    raise
+                await asyncio.sleep(wait_time)
+    
+    def _retry_wait(self, error: Exception, attempt: int, max_retries: int, idempotent: bool) -> Optional[float]:
+        """
+        Handle a failed attempt: back off the shared rate limiter on 429 and work
+        out how long to wait before retrying.
+        
+        Returns:
+            Seconds to wait, or None if the error should be raised
+        """
+        if isinstance(error, HTTPResponseError) and error.status == 429:
+            self._bucket.penalize()
+        if attempt >= max_retries - 1 or not _is_retryable(error, idempotent):
+            return None
+        wait_time = random.uniform(0, min(MAX_DELAY, BASE_DELAY * (2 ** attempt)))
+        retry_after = _retry_after_seconds(error)
+        if retry_after is not None:
+            wait_time = max(retry_after, wait_time)
+        logger.warning("Retry %s/%s after %.2fs: %s", attempt + 1, max_retries, wait_time, error)
+        return wait_time
+    
+    def _resolve_wanted_property_ids(self, schema_properties: Dict[str, Any]) -> List[str]:
+        """Resolve the property IDs the mapper reads from the database schema."""
+        property_ids = []
+        for possible_keys in _CONTACT_PROPERTY_KEYS:
+            key = self._find_property_key(schema_properties, possible_keys)
+            if key is not None and schema_properties[key].get("id"):
+                property_ids.append(schema_properties[key]["id"])
+        return property_ids
+    
+    def _get_schema(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Get the database properties schema, cached for SCHEMA_TTL seconds.
+        
+        Args:
+            force: Re-retrieve the schema even if the cached copy is still fresh
+        """
+        if not force and self._schema_cache is not None:
+            fetched_at, schema = self._schema_cache
+            if time.monotonic() - fetched_at < SCHEMA_TTL:
+                return schema
+        
+        database = self._with_retry(self.client.databases.retrieve, self.database_id)
+        schema = database.get("properties", {})
+        self._schema_cache = (time.monotonic(), schema)
+        if force:
+            # Columns may have been added/renamed, so re-resolve on next fetch
+            self._wanted_property_ids = None
+        return schema
+    
+    def _get_wanted_property_ids(self) -> Optional[List[str]]:
+        """
+        Get the property IDs to pass as filter_properties.
+        
+        Returns None (fetch every property) if the schema can't be retrieved.
+        """
+        if self._wanted_property_ids is None:
+            try:
+                schema = self._get_schema()
+            except Exception as e:
+                logger.warning("Could not retrieve database schema, fetching all properties: %s", e)
+                return None
+            self._wanted_property_ids = self._resolve_wanted_property_ids(schema)
+        return self._wanted_property_ids or None
+    
+    def _build_query_params(
+        self,
+        page_size: int,
+        start_cursor: Optional[str] = None,
+        edited_since: Optional[str] = None,
+        property_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Build databases.query parameters for one page of results."""
+        query_params = {
+            "database_id": self.database_id,
+            "page_size": min(page_size, 100),
+        }
+        if property_ids:
+            # Only return the properties the mapper reads
+            query_params["filter_properties"] = property_ids
+        if start_cursor:
+            query_params["start_cursor"] = start_cursor
+        if edited_since:
+            # Notion timestamps are minute-granular, so use on_or_after to avoid
+            # missing edits made in the same minute as the high-water mark
+            query_params["filter"] = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": edited_since},
+            }
+        return query_params
+    
+    def _incremental_since(self, incremental: bool) -> Optional[str]:
+        """Return the high-water mark to sync from, or None for a full fetch."""
+        if incremental and self._snapshot is not None:
+            return self._high_water_mark
+        return None
+    
+    def _merge_snapshot(self, contacts: List[Dict[str, Any]], edited_since: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Merge fetched contacts into the snapshot and advance the high-water mark.
+        
+        A full fetch (edited_since is None) replaces the snapshot; an incremental
+        fetch only overwrites the contacts that changed.
+        """
+        if edited_since is None or self._snapshot is None:
+            self._snapshot = {}
+            self._high_water_mark = None
+        
+        high_water_mark = self._high_water_mark
+        for contact in contacts:
+            self._snapshot[contact["id"]] = contact
+            edited = contact.get("_notion_last_edited_time")
+            if edited and (high_water_mark is None or edited > high_water_mark):
+                high_water_mark = edited
+        self._high_water_mark = high_water_mark
+        
+        return list(self._snapshot.values())
+    
+    def _iter_page_contacts(self, results: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Map one page of query results to contacts, skipping pages that fail to map."""
+        skipped = 0
+        for page in results:
+            # Cheap structural check before mapping: pages without an id or
+            # properties (partial/archived rows) are skipped without raising
+            properties = page.get("properties")
+            if not properties or not page.get("id"):
+                skipped += 1
+                continue
+            
+            # Keep only the fields the mapper reads; drop cover/icon/parent/url etc.
+            page = {
+                "id": page["id"],
+                "last_edited_time": page.get("last_edited_time"),
+                "properties": properties,
+            }
+            try:
+                contact = self._map_notion_to_contact(page)
+            except Exception as e:
+                logger.debug("Error mapping contact %s: %s", page['id'], e)
+                skipped += 1
+                continue
+            yield contact
+        
+        if skipped:
+            logger.warning("Skipped %s malformed pages", skipped)
+    
+    def iter_contacts(
+        self,
+        page_size: int = 100,
+        max_retries: int = 3,
+        edited_since: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream contacts from Notion database one at a time, with retry logic.
+        
+        Only one page of results is held in memory at a time, and the first
+        contact is available after the first page arrives.
+        
+        Args:
+            page_size: Number of results per page (max 100)
+            max_retries: Maximum number of retry attempts for failed requests
+            edited_since: Only yield contacts edited on or after this ISO timestamp
+        
+        Yields:
+            Contact dictionaries
+        """
+        property_ids = self._get_wanted_property_ids()
+        
+        def query_page(start_cursor: Optional[str]) -> Dict[str, Any]:
+            query_params = self._build_query_params(page_size, start_cursor, edited_since, property_ids)
+            return self._with_retry(self.client.databases.query, max_retries=max_retries, **query_params)
+        
+        try:
+            # The next page is fetched on the prefetch thread as soon as its cursor
+            # is known, overlapping the network round-trip with mapping this page
+            response = query_page(None)
+            while True:
+                future = None
+                start_cursor = response.get("next_cursor")
+                if response.get("has_more", False) and start_cursor:
+                    future = self._executor.submit(query_page, start_cursor)
+                
+                yield from self._iter_page_contacts(response.get("results", []))
+                
+                if future is None:
+                    break
+                response = future.result()
+                
+        except APIResponseError as e:
+            logger.error("Notion API error fetching contacts: %s", e)
+            raise
+        except Exception as e:
+            logger.error("Unexpected error fetching contacts: %s", e)
+            raise
+    
+    def get_all_contacts(
+        self,
+        page_size: int = 100,
+        max_retries: int = 3,
+        incremental: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Fetch all contacts from Notion database with retry logic.
         
         Args:
             page_size: Number of results per page (max 100)
             max_retries: Maximum number of retry attempts for failed requests
+            incremental: If True and a previous fetch exists, only query pages edited
+                since the last fetch and merge them into it. Pages archived in Notion
+                are not picked up until the next full fetch.
         
         Returns:
             List of contact dictionaries
         """
+        edited_since = self._incremental_since(incremental)
+        contacts = list(self.iter_contacts(page_size, max_retries, edited_since))
+        return self._merge_snapshot(contacts, edited_since)
+    
+    async def aget_all_contacts(
+        self,
+        page_size: int = 100,
+        max_retries: int = 3,
+        incremental: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch all contacts from Notion database without blocking the event loop.
+        
+        Async counterpart of get_all_contacts for use from async endpoints.
+        
+        Args:
+            page_size: Number of results per page (max 100)
+            max_retries: Maximum number of retry attempts for failed requests
+            incremental: Only query pages edited since the last fetch (see get_all_contacts)
+        
+        Returns:
+            List of contact dictionaries
+        """
+        client = self._get_async_client()
         contacts = []
         has_more = True
         start_cursor = None
+        edited_since = self._incremental_since(incremental)
         
-        retry_count = 0
+        # Resolved through the (TTL-cached) schema on a worker thread
+        property_ids = await asyncio.to_thread(self._get_wanted_property_ids)
         
         try:
             while has_more:
-                query_params = {
-                    "database_id": self.database_id,
-                    "page_size": min(page_size, 100),
-                }
-                if start_cursor:
-                    query_params["start_cursor"] = start_cursor
+                query_params = self._build_query_params(page_size, start_cursor, edited_since, property_ids)
+                response = await self._awith_retry(client.databases.query, max_retries=max_retries, **query_params)
                 
-                # Retry logic for API calls
-                response = None
-                last_error = None
-                for attempt in range(max_retries):
-                    try:
-                        response = self.client.databases.query(**query_params)
-                        retry_count = 0  # Reset retry count on success
-                        break
-                    except (APIResponseError, Exception) as e:
-                        last_error = e
-                        if attempt < max_retries - 1:
-                            wait_time = (attempt + 1) * 1  # Exponential backoff: 1s, 2s, 3s
-                            logger.warning(f"Retry {attempt + 1}/{max_retries} after {wait_time}s: {e}")
-                            time.sleep(wait_time)
-                        else:
-                            raise
-                
-                if response is None:
-                    raise last_error
-                
-                for page in response.get("results", []):
-                    try:
-                        contact = self._map_notion_to_contact(page)
-                        contacts.append(contact)
-                    except Exception as e:
-                        logger.warning(f"Error mapping contact: {e}, skipping...")
-                        continue
+                contacts.extend(self._iter_page_contacts(response.get("results", [])))
                 
                 has_more = response.get("has_more", False)
                 start_cursor = response.get("next_cursor")
-                
-                # Small delay between pages to avoid rate limiting
-                if has_more:
-                    time.sleep(0.1)
-                
         except APIResponseError as e:
-            logger.error(f"Notion API error fetching contacts: {e}")
+            logger.error("Notion API error fetching contacts: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error fetching contacts: {e}")
+            logger.error("Unexpected error fetching contacts: %s", e)
             raise
         
-        return contacts
+        return self._merge_snapshot(contacts, edited_since)
+    
+    def _get_cached_contact(self, contact_id: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached contact if present and younger than CONTACT_TTL."""
+        with self._contact_cache_lock:
+            entry = self._contact_cache.get(contact_id)
+            if entry is None:
+                return None
+            fetched_at, contact = entry
+            if time.monotonic() - fetched_at >= CONTACT_TTL:
+                del self._contact_cache[contact_id]
+                return None
+            self._contact_cache.move_to_end(contact_id)
+            return dict(contact)
     
-    def get_contact(self, contact_id: str) -> Optional[Dict[str, Any]]:
+    def _cache_contact(self, contact_id: str, contact: Dict[str, Any]):
+        """Insert a contact into the LRU cache, evicting the oldest entry when full."""
+        with self._contact_cache_lock:
+            self._contact_cache[contact_id] = (time.monotonic(), contact)
+            self._contact_cache.move_to_end(contact_id)
+            if len(self._contact_cache) > CONTACT_CACHE_MAXSIZE:
+                self._contact_cache.popitem(last=False)
+    
+    def _invalidate_contact(self, contact_id: str):
+        """Drop a contact from the read cache."""
+        with self._contact_cache_lock:
+            self._contact_cache.pop(contact_id, None)
+    
+    def get_contact(self, contact_id: str, use_cache: bool = False) -> Optional[Dict[str, Any]]:
         """
         Fetch a single contact by ID.
         
         Args:
             contact_id: Notion page ID
+            use_cache: Serve repeat reads within CONTACT_TTL seconds from memory
         
         Returns:
             Contact dictionary or None if not found
         """
+        if use_cache:
+            cached = self._get_cached_contact(contact_id)
+            if cached is not None:
+                return cached
+        
         try:
-            page = self.client.pages.retrieve(contact_id)
-            return self._map_notion_to_contact(page)
+            page = self._with_retry(self.client.pages.retrieve, contact_id)
+            contact = self._map_notion_to_contact(page)
+            if use_cache:
+                self._cache_contact(contact_id, dict(contact))
+            return contact
         except APIResponseError as e:
             if e.code == "object_not_found":
                 return None
-            logger.error(f"Notion API error fetching contact {contact_id}: {e}")
+            logger.error("Notion API error fetching contact %s: %s", contact_id, e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error fetching contact {contact_id}: {e}")
+            logger.error("Unexpected error fetching contact %s: %s", contact_id, e)
             raise
     
-    def create_contact(self, contact: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Create a new contact in Notion.
-        
-        Args:
-            contact: Contact data dictionary
-        
-        Returns:
-            Created contact dictionary
-        """
+    def _prepare_new_contact(self, contact: Dict[str, Any]):
+        """Validate required fields and fill in defaults for a contact about to be created."""
         # Validate required fields
         if not contact.get("name"):
             raise ValueError("Name is required")
@@ -704,38 +1216,140 @@ class NotionContactClient:
         if "status" not in contact:
             contact["status"] = "queued"
         if "created_date" not in contact:
-            contact["created_date"] = datetime.now().date().isoformat()
+            contact["created_date"] = _today_iso()
         if "days_at_current_status" not in contact:
             contact["days_at_current_status"] = 0
+    
+    def create_contact(self, contact: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new contact in Notion.
         
-        # Get database schema to use correct property names
-        try:
-            database = self.client.databases.retrieve(self.database_id)
-            existing_properties = database.get("properties", {})
-        except APIResponseError as e:
-            logger.warning(f"Could not retrieve database schema, using default property names: {e}")
-            existing_properties = {}
+        Args:
+            contact: Contact data dictionary
         
-        properties = self._map_contact_to_notion(contact, existing_properties)
+        Returns:
+            Created contact dictionary
+        """
+        self._prepare_new_contact(contact)
+        existing_properties = self._get_schema_for_create()
         
         try:
-            page = self.client.pages.create(
-                parent={"database_id": self.database_id},
-                properties=properties
-            )
-            return self._map_notion_to_contact(page)
+            return self._create_with_schema(contact, existing_properties)
         except APIResponseError as e:
-            error_msg = str(e)
             # Log the full error details for debugging
-            logger.error(f"Notion API error creating contact: {error_msg}")
+            logger.error("Notion API error creating contact: %s", e)
             if hasattr(e, 'body') and e.body:
-                logger.error(f"Notion API error body: {e.body}")
+                logger.error("Notion API error body: %s", e.body)
             # Re-raise with a more user-friendly message
-            raise ValueError(f"Failed to create contact in Notion: {error_msg}")
+            raise ValueError(f"Failed to create contact in Notion: {e}")
         except Exception as e:
-            error_msg = str(e)
-            logger.error(f"Unexpected error creating contact: {error_msg}", exc_info=True)
-            raise ValueError(f"Failed to create contact: {error_msg}")
+            logger.error("Unexpected error creating contact: %s", e, exc_info=True)
+            raise ValueError(f"Failed to create contact: {e}")
+    
+    def _get_schema_for_create(self) -> Dict[str, Any]:
+        """Get the database schema for mapping new contacts (empty if it can't be retrieved)."""
+        try:
+            return self._get_schema()
+        except APIResponseError as e:
+            logger.warning("Could not retrieve database schema, using default property names: %s", e)
+            return {}
+    
+    def _create_with_schema(self, contact: Dict[str, Any], existing_properties: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map a prepared contact with the given schema and create its page.
+        
+        On a validation error the schema may be stale (column added/renamed), so it is
+        refreshed once and the create retried. Concurrent creates that failed against
+        the same stale schema share a single refresh.
+        
+        Returns:
+            Created contact dictionary
+        """
+        properties = self._map_contact_to_notion(contact, existing_properties)
+        try:
+            page = self._create_page(properties)
+        except APIResponseError as e:
+            if e.code != "validation_error":
+                raise
+            logger.warning("Validation error creating contact, retrying with refreshed schema: %s", e)
+            with self._schema_refresh_lock:
+                cached = self._schema_cache
+                if cached is not None and cached[1] is not existing_properties:
+                    # Another thread already refreshed it
+                    schema = cached[1]
+                else:
+                    schema = self._get_schema(force=True)
+            properties = self._map_contact_to_notion(contact, schema)
+            page = self._create_page(properties)
+        return self._map_notion_to_contact(page)
+    
+    def _create_page(self, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a page in the contacts database."""
+        return self._with_retry(
+            self.client.pages.create,
+            idempotent=False,
+            parent={"database_id": self.database_id},
+            properties=properties
+        )
+    
+    def create_contacts(self, contacts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create several contacts concurrently (see create_contacts_bulk).
+        
+        Args:
+            contacts: List of contact data dictionaries
+        
+        Returns:
+            Created contact dictionaries, in the same order as the input
+        
+        Raises:
+            ValueError: If any contact failed to be created (others may have been)
+        """
+        results = self.create_contacts_bulk(contacts)
+        for contact, result in zip(contacts, results):
+            if not result["ok"]:
+                raise ValueError(f"Failed to create contact {contact.get('name')}: {result['error']}")
+        return [result["contact"] for result in results]
+    
+    def create_contacts_bulk(self, contacts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create many contacts concurrently, collecting failures instead of aborting.
+        
+        The schema is fetched once and every contact validated up front; the
+        creates run on the thread pool (rate-limited by the token bucket), each
+        retrying once with a refreshed schema on a validation error.
+        
+        Args:
+            contacts: List of contact data dictionaries
+        
+        Returns:
+            One {"ok": bool, "contact": dict or None, "error": str or None} per input
+            contact, in the same order
+        """
+        existing_properties = self._get_schema_for_create()
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(contacts)
+        pending = []
+        for i, contact in enumerate(contacts):
+            try:
+                self._prepare_new_contact(contact)
+                pending.append(i)
+            except Exception as e:
+                results[i] = {"ok": False, "contact": None, "error": str(e)}
+        
+        with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+            futures = [
+                (i, executor.submit(self._create_with_schema, contacts[i], existing_properties))
+                for i in pending
+            ]
+            for i, future in futures:
+                try:
+                    results[i] = {"ok": True, "contact": future.result(), "error": None}
+                except Exception as e:
+                    logger.error("Error creating contact %s: %s", contacts[i].get('name'), e)
+                    results[i] = {"ok": False, "contact": None, "error": str(e)}
+        
+        return results
     
     def update_contact(self, contact_id: str, contact: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -748,14 +1362,13 @@ class NotionContactClient:
         Returns:
             Updated contact dictionary
         """
-        # Get existing page to preserve property name casing
+        # Property names are database-wide, so the cached schema preserves casing
+        # without retrieving the page; a missing page surfaces from pages.update below
         try:
-            existing_page = self.client.pages.retrieve(contact_id)
-            existing_properties = existing_page.get("properties", {})
+            existing_properties = self._get_schema()
         except APIResponseError as e:
-            if e.code == "object_not_found":
-                raise ValueError(f"Contact {contact_id} not found")
-            raise
+            logger.warning("Could not retrieve database schema, using default property names: %s", e)
+            existing_properties = {}
         
         properties = self._map_contact_to_notion(contact, existing_properties)
         
@@ -763,25 +1376,38 @@ class NotionContactClient:
             raise ValueError("No properties to update")
         
         try:
-            page = self.client.pages.update(
+            page = self._with_retry(
+                self.client.pages.update,
                 page_id=contact_id,
                 properties=properties
             )
+            self._invalidate_contact(contact_id)
             return self._map_notion_to_contact(page)
         except APIResponseError as e:
             if e.code == "object_not_found":
                 raise ValueError(f"Contact {contact_id} not found")
-            error_msg = str(e)
             # Log the full error details for debugging
-            logger.error(f"Notion API error updating contact {contact_id}: {error_msg}")
+            logger.error("Notion API error updating contact %s: %s", contact_id, e)
             if hasattr(e, 'body') and e.body:
-                logger.error(f"Notion API error body: {e.body}")
+                logger.error("Notion API error body: %s", e.body)
             # Re-raise with a more user-friendly message
-            raise ValueError(f"Failed to update contact in Notion: {error_msg}")
+            raise ValueError(f"Failed to update contact in Notion: {e}")
         except Exception as e:
-            error_msg = str(e)
-            logger.error(f"Unexpected error updating contact {contact_id}: {error_msg}", exc_info=True)
-            raise ValueError(f"Failed to update contact: {error_msg}")
+            logger.error("Unexpected error updating contact %s: %s", contact_id, e, exc_info=True)
+            raise ValueError(f"Failed to update contact: {e}")
+    
+    def update_contacts(self, updates: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Update several contacts concurrently.
+        
+        Args:
+            updates: List of (contact_id, contact data dictionary) pairs
+        
+        Returns:
+            Updated contact dictionaries, in the same order as the input
+        """
+        with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+            return list(executor.map(lambda update: self.update_contact(*update), updates))
     
     def delete_contact(self, contact_id: str) -> bool:
         """
@@ -797,14 +1423,38 @@ class NotionContactClient:
         """
         try:
             # Archive the page (Notion's way of "deleting")
-            self.client.pages.update(
+            self._with_retry(
+                self.client.pages.update,
                 page_id=contact_id,
                 archived=True
             )
+            if self._snapshot is not None:
+                self._snapshot.pop(contact_id, None)
+            self._invalidate_contact(contact_id)
             return True
         except APIResponseError as e:
-            logger.error(f"Notion API error deleting contact {contact_id}: {e}")
+            logger.error("Notion API error deleting contact %s: %s", contact_id, e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error deleting contact {contact_id}: {e}")
+            logger.error("Unexpected error deleting contact %s: %s", contact_id, e)
             raise
+    
+    def _delete_one(self, contact_id: str) -> Tuple[str, bool, Optional[str]]:
+        """Archive one contact, returning (contact_id, ok, error) instead of raising."""
+        try:
+            return contact_id, self.delete_contact(contact_id), None
+        except Exception as e:
+            return contact_id, False, str(e)
+    
+    def delete_contacts(self, contact_ids: List[str]) -> List[Tuple[str, bool, Optional[str]]]:
+        """
+        Archive several contacts concurrently.
+        
+        Args:
+            contact_ids: Notion page IDs
+        
+        Returns:
+            (contact_id, ok, error) per input ID, in the same order
+        """
+        with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+            return list(executor.map(self._delete_one, contact_ids))
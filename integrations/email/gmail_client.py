@@ -3,18 +3,40 @@ Gmail API integration client.
 
 Handles OAuth authentication and email sending/receiving via Gmail API.
 """
+import asyncio
 import os
+import random
+import re
 import base64
+import binascii
+import heapq
 import json
+import operator
 import socket
+import tempfile
 import threading
-from typing import Optional, List, Dict, Any
-from datetime import datetime
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
+from datetime import datetime, timezone
+from email.header import Header
+from email.utils import formataddr, getaddresses, parsedate_to_datetime
 import logging
 
 try:
+    import fcntl
+except ImportError:
+    # Not available on Windows; token file access is then unlocked
+    fcntl = None
+
+try:
+    import httplib2
+    import requests
+    from google_auth_httplib2 import AuthorizedHttp
+    from requests.adapters import HTTPAdapter
     from google.auth.transport.requests import Request
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
@@ -29,6 +51,156 @@ logger = logging.getLogger(__name__)
 # Gmail API scopes
 SCOPES = ['https://www.googleapis.com/auth/gmail.send', 'https://www.googleapis.com/auth/gmail.readonly']
 
+# OAuth redirect host; Google allows http://localhost for desktop apps, and the
+# actual redirect goes to the port the local server listens on
+OAUTH_REDIRECT_BASE = "http://localhost"
+
+# Refresh access tokens in the background once they have less than this many seconds left
+# (Google access tokens live for an hour)
+TOKEN_REFRESH_MARGIN = 600
+
+# Strips HTML tags from raw (undecoded) HTML bodies
+_HTML_TAG_RE = re.compile(rb'<[^>]+>')
+
+# Sub-requests per Gmail batch call (API max is 100; Google recommends <= 50)
+GMAIL_BATCH_SIZE = 50
+
+# Retries (exponential backoff with jitter, on 429/5xx) for idempotent Gmail reads,
+# including failed sub-requests of batch calls
+GMAIL_NUM_RETRIES = 3
+GMAIL_RETRY_BASE_DELAY = 1.0
+GMAIL_RETRY_MAX_DELAY = 30.0
+
+# Max Gmail accounts queried at once by the manager's async fan-out
+GMAIL_MAX_CONCURRENCY = int(os.getenv("GMAIL_MAX_CONCURRENCY", "8"))
+
+# Batch calls sent in parallel when a fetch needs more than one
+GMAIL_BATCH_MAX_WORKERS = 4
+
+# Parsed messages memoized per client (Gmail message IDs are immutable)
+PARSE_CACHE_MAXSIZE = 1024
+
+# Seconds the authenticated account's profile email is reused before re-fetching
+PROFILE_CACHE_TTL = 3600
+
+
+# Process-wide google-auth Request used for token refreshes when no session is injected
+_SHARED_REFRESH_REQUEST = None
+_shared_refresh_request_lock = threading.Lock()
+
+
+def _get_refresh_request() -> 'Request':
+    """Get the shared refresh Request, building its requests.Session only once."""
+    global _SHARED_REFRESH_REQUEST
+    if _SHARED_REFRESH_REQUEST is None:
+        with _shared_refresh_request_lock:
+            if _SHARED_REFRESH_REQUEST is None:
+                _SHARED_REFRESH_REQUEST = Request()
+    return _SHARED_REFRESH_REQUEST
+
+
+# HTML alternative for outgoing emails, with full-width styling so Gmail doesn't narrow it
+_HTML_EMAIL_TEMPLATE = """
+            <!DOCTYPE html>
+            <html>
+            <head>
+                <meta charset="UTF-8">
+            </head>
+            <body style="margin: 0; padding: 0; font-family: Arial, sans-serif; font-size: 14px; line-height: 1.6; color: #333; max-width: 100%; width: 100%;">
+                <div style="max-width: 100%; width: 100%; padding: 20px;">
+                    {html_body}
+                </div>
+            </body>
+            </html>
+            """
+
+
+def _encode_header(value: str) -> str:
+    """RFC 2047-encode a header value if it isn't plain ASCII (folded with CRLF)."""
+    value = value.replace('\r', ' ').replace('\n', ' ')
+    if value.isascii():
+        return value
+    return Header(value, 'utf-8').encode(linesep='\r\n')
+
+
+def _encode_address(value: str) -> str:
+    """
+    Encode an address header (one or more comma-separated addresses), encoding
+    only the display names that aren't ASCII.
+    """
+    value = value.replace('\r', ' ').replace('\n', ' ')
+    if value.isascii():
+        return value
+    addresses = []
+    for name, addr in getaddresses([value]):
+        if name and not name.isascii():
+            addresses.append(f"{_encode_header(name)} <{addr}>")
+        else:
+            addresses.append(formataddr((name, addr)))
+    return ', '.join(addresses)
+
+
+def _build_raw_message(to_address: str, from_address: str, subject: str, body: str) -> bytes:
+    """
+    Build a multipart/alternative (plain text + HTML) RFC 2822 message.
+    
+    Assembled directly instead of through email.mime, whose generator dominates the
+    CPU cost of a send. Parts are base64-encoded to stay within line-length limits.
+    """
+    boundary = f"===============crm{uuid.uuid4().hex}=="
+    html_content = _HTML_EMAIL_TEMPLATE.format(html_body=body.replace('\n', '<br>'))
+    text_b64 = base64.encodebytes(body.encode('utf-8')).replace(b'\n', b'\r\n')
+    html_b64 = base64.encodebytes(html_content.encode('utf-8')).replace(b'\n', b'\r\n')
+    part_headers = (
+        "Content-Type: text/{subtype}; charset=\"utf-8\"\r\n"
+        "MIME-Version: 1.0\r\n"
+        "Content-Transfer-Encoding: base64\r\n\r\n"
+    )
+    headers = (
+        f"Content-Type: multipart/alternative; boundary=\"{boundary}\"\r\n"
+        f"MIME-Version: 1.0\r\n"
+        f"to: {_encode_address(to_address)}\r\n"
+        f"from: {_encode_address(from_address)}\r\n"
+        f"subject: {_encode_header(subject)}\r\n"
+        f"X-CRM-Sent: true\r\n\r\n"
+    )
+    return b''.join((
+        headers.encode('ascii'),
+        f"--{boundary}\r\n".encode('ascii'),
+        part_headers.format(subtype='plain').encode('ascii'),
+        text_b64,
+        f"--{boundary}\r\n".encode('ascii'),
+        part_headers.format(subtype='html').encode('ascii'),
+        html_b64,
+        f"--{boundary}--\r\n".encode('ascii'),
+    ))
+
+
+def _has_crm_header(headers: List[Dict[str, str]]) -> bool:
+    """Whether a message's headers include X-CRM-Sent (i.e. it was sent from the CRM)."""
+    return any(h.get('name', '').lower() == 'x-crm-sent' for h in headers)
+
+
+def _stamp_account(messages: List[Dict[str, Any]], account_email: str):
+    """
+    Tag messages with their account email and their internalDate (epoch ms) as an int.
+    
+    The int date is stored under '_ts' so sorting converts each date only once.
+    """
+    for msg in messages:
+        msg['_account_email'] = account_email
+        msg['_ts'] = int(msg.get('internalDate', 0))
+
+
+def _newest_first(messages: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    """The `limit` newest stamped messages, newest first, without sorting the whole list."""
+    return heapq.nlargest(limit, messages, key=operator.itemgetter('_ts'))
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime (the convention google-auth uses for expiry)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 
 class GmailClient:
     """Client for Gmail API operations with multi-account support."""
@@ -39,7 +211,8 @@ class GmailClient:
         client_secret: Optional[str] = None,
         redirect_uri: Optional[str] = None,
         token_file: Optional[str] = None,
-        account_email: Optional[str] = None
+        account_email: Optional[str] = None,
+        session: Optional['requests.Session'] = None
     ):
         """
         Initialize Gmail client for a specific account.
@@ -50,6 +223,8 @@ class GmailClient:
             redirect_uri: OAuth redirect URI (or from env GMAIL_REDIRECT_URI)
             token_file: Path to token file (defaults to integrations/email/token_{account_email}.json)
             account_email: Email address for this account (used for token file naming)
+            session: requests.Session used for token refreshes (lets several clients
+                share one connection pool to the OAuth endpoint)
         """
         try:
             from google.auth.transport.requests import Request
@@ -95,12 +270,25 @@ class GmailClient:
         
         self.service = None
         self.credentials = None
+        # Reused for every token refresh instead of building a new Request/Session each time
+        self._refresh_request = Request(session=session) if session is not None else _get_refresh_request()
         # Lock to prevent concurrent OAuth flows
         self._oauth_lock = threading.Lock()
+        # Guards the single in-flight background token refresh
+        self._refresh_lock = threading.Lock()
+        self._refresh_in_flight = False
+        # Cached getProfile() email address and when it was fetched
+        self._cached_profile_email: Optional[str] = None
+        self._cached_profile_ts: float = 0
+        # LRU of message id -> parsed message, see parse_message
+        self._parse_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+        # Per-thread authorized connections, see _get_http
+        self._thread_local = threading.local()
     
     def _find_available_port(self, preferred_port: int, exclude: Optional[List[int]] = None) -> int:
         """
-        Find an available port, starting with the preferred port.
+        Find an available port: the preferred port if free, otherwise one assigned by the OS.
         
         Args:
             preferred_port: The preferred port to use
@@ -115,19 +303,11 @@ class GmailClient:
         if preferred_port not in exclude and self._is_port_available(preferred_port):
             return preferred_port
         
-        # Try nearby ports (preferred_port ± 1, ± 2, etc.)
-        for offset in range(1, 100):
-            for port in [preferred_port + offset, preferred_port - offset]:
-                if port > 0 and port < 65536 and port not in exclude:
-                    if self._is_port_available(port):
-                        logger.info(f"Using alternative port {port} (preferred {preferred_port} was unavailable)")
-                        return port
-        
-        # Fallback: let the system assign a port
+        # Otherwise let the system assign a free port in a single bind
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             s.bind(('', 0))
             port = s.getsockname()[1]
-            logger.info(f"System assigned port {port}")
+            logger.info(f"System assigned port {port} (preferred {preferred_port} was unavailable)")
             return port
     
     def _is_port_available(self, port: int) -> bool:
@@ -153,18 +333,32 @@ class GmailClient:
         creds = None
         
         # Load existing token
-        if os.path.exists(self.token_file):
+        try:
+            creds = self._load_credentials()
+        except Exception as e:
+            logger.warning(f"Error loading token: {e}")
+        
+        # A loaded token that is still valid but inside the proactive refresh window is
+        # refreshed now, so a new process doesn't start on a nearly expired token.
+        # (google-auth already reports tokens within its own ~4 minute threshold as
+        # invalid; those are refreshed by the expired-token path below.)
+        if (
+            creds and creds.valid and creds.refresh_token and creds.expiry
+            and (creds.expiry - _utcnow()).total_seconds() < TOKEN_REFRESH_MARGIN
+        ):
             try:
-                creds = Credentials.from_authorized_user_file(self.token_file, SCOPES)
+                creds.refresh(self._refresh_request)
+                self._save_credentials(creds)
             except Exception as e:
-                logger.warning(f"Error loading token: {e}")
+                # Keep the still-valid token; the proactive refresh will retry
+                logger.warning(f"Error refreshing soon-to-expire token: {e}")
         
         # If there are no (valid) credentials available, start OAuth flow
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
                 # Refresh expired token
                 try:
-                    creds.refresh(Request())
+                    creds.refresh(self._refresh_request)
                 except Exception as e:
                     logger.warning(f"Error refreshing token: {e}")
                     creds = None
@@ -172,14 +366,13 @@ class GmailClient:
             if not creds:
                 # Start OAuth flow - use lock to prevent concurrent flows
                 with self._oauth_lock:
-                    # Double-check credentials weren't created by another thread
-                    if os.path.exists(self.token_file):
-                        try:
-                            creds = Credentials.from_authorized_user_file(self.token_file, SCOPES)
-                            if creds and creds.valid:
-                                return creds
-                        except Exception:
-                            pass
+                    # Double-check credentials weren't created by another thread/process
+                    try:
+                        creds = self._load_credentials()
+                        if creds and creds.valid:
+                            return creds
+                    except Exception:
+                        pass
                     
                     # Log why OAuth flow is being triggered
                     if not os.path.exists(self.token_file):
@@ -194,7 +387,6 @@ class GmailClient:
                     # Extract port from redirect_uri if specified, otherwise use default 8080
                     # For desktop apps, Google allows http://localhost or http://127.0.0.1
                     # We'll use a fixed port to match what's registered in Google Cloud Console
-                    import re
                     port_match = re.search(r':(\d+)', self.redirect_uri)
                     if port_match:
                         preferred_port = int(port_match.group(1))
@@ -202,25 +394,10 @@ class GmailClient:
                         # Default to 8080 if no port specified
                         preferred_port = 8080
                     
-                    # Find an available port (try preferred port first, then try nearby ports)
+                    # Find an available port (the preferred port if free, otherwise one assigned by the OS)
                     oauth_port = self._find_available_port(preferred_port)
                     
-                    # Use http://localhost for redirect (Google allows this for desktop apps)
-                    # The actual redirect will be to the port we specify
-                    redirect_base = "http://localhost"
-                    
-                    flow = InstalledAppFlow.from_client_config(
-                        {
-                            "installed": {
-                                "client_id": self.client_id,
-                                "client_secret": self.client_secret,
-                                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                                "token_uri": "https://oauth2.googleapis.com/token",
-                                "redirect_uris": [f"{redirect_base}:{oauth_port}/"],
-                            }
-                        },
-                        SCOPES
-                    )
+                    flow = self._make_flow(oauth_port)
                     
                     # Try to run the OAuth server, handling port conflicts gracefully
                     try:
@@ -231,19 +408,8 @@ class GmailClient:
                             # Try to find another available port
                             logger.warning(f"Port {oauth_port} is in use, trying alternative port...")
                             oauth_port = self._find_available_port(preferred_port, exclude=[oauth_port])
-                            # Update redirect URI in flow config
-                            flow = InstalledAppFlow.from_client_config(
-                                {
-                                    "installed": {
-                                        "client_id": self.client_id,
-                                        "client_secret": self.client_secret,
-                                        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                                        "token_uri": "https://oauth2.googleapis.com/token",
-                                        "redirect_uris": [f"{redirect_base}:{oauth_port}/"],
-                                    }
-                                },
-                                SCOPES
-                            )
+                            # Point the existing flow at the new port
+                            flow.redirect_uri = f"{OAUTH_REDIRECT_BASE}:{oauth_port}/"
                             logger.info(f"Retrying OAuth flow on alternative port {oauth_port}...")
                             creds = flow.run_local_server(port=oauth_port, open_browser=True)
                         else:
@@ -257,11 +423,104 @@ class GmailClient:
                         raise
             
             # Save credentials for next run
-            with open(self.token_file, 'w') as token:
-                token.write(creds.to_json())
+            self._save_credentials(creds)
         
         return creds
     
+    def _make_flow(self, port: int) -> 'InstalledAppFlow':
+        """Build the installed-app OAuth flow, redirecting to localhost on the given port."""
+        return InstalledAppFlow.from_client_config(
+            {
+                "installed": {
+                    "client_id": self.client_id,
+                    "client_secret": self.client_secret,
+                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+                    "token_uri": "https://oauth2.googleapis.com/token",
+                    "redirect_uris": [f"{OAUTH_REDIRECT_BASE}:{port}/"],
+                }
+            },
+            SCOPES
+        )
+    
+    @contextmanager
+    def _token_file_lock(self, exclusive: bool):
+        """
+        Hold a shared (read) or exclusive (write) lock on the token file.
+        
+        Locks a sidecar .lock file rather than the token file itself, since writes
+        replace the token file with a new inode.
+        """
+        if fcntl is None:
+            yield
+            return
+        with open(f"{self.token_file}.lock", 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _load_credentials(self) -> Optional['Credentials']:
+        """Load credentials from the token file (None if there is no token file)."""
+        try:
+            with self._token_file_lock(exclusive=False):
+                with open(self.token_file, 'rb') as f:
+                    data = f.read()
+        except FileNotFoundError:
+            return None
+        return Credentials.from_authorized_user_info(json.loads(data), SCOPES)
+    
+    def _save_credentials(self, creds: 'Credentials'):
+        """
+        Persist credentials to the token file.
+        
+        Writes to a temp file and renames it into place so concurrent readers (other
+        threads or worker processes) never see a partially written token.
+        """
+        token_dir = os.path.dirname(os.path.abspath(self.token_file))
+        with self._token_file_lock(exclusive=True):
+            with tempfile.NamedTemporaryFile('w', dir=token_dir, delete=False, suffix='.tmp') as tmp:
+                tmp.write(creds.to_json())
+            os.replace(tmp.name, self.token_file)
+    
+    def _refresh_if_expiring(self):
+        """
+        Refresh the access token in the background if it's about to expire.
+        
+        The current request keeps using the still-valid token; the refresh updates
+        the shared credentials object in place, so the cached service picks up the
+        new token without being rebuilt.
+        """
+        creds = self.credentials
+        if not creds or not creds.refresh_token or not creds.expiry:
+            return
+        if (creds.expiry - _utcnow()).total_seconds() >= TOKEN_REFRESH_MARGIN:
+            return
+        
+        with self._refresh_lock:
+            if self._refresh_in_flight:
+                return
+            self._refresh_in_flight = True
+        
+        threading.Thread(
+            target=self._refresh_credentials,
+            args=(creds,),
+            name=f"gmail-token-refresh-{self.account_email}",
+            daemon=True
+        ).start()
+    
+    def _refresh_credentials(self, creds: 'Credentials'):
+        """Refresh credentials and persist them (runs on a background thread)."""
+        try:
+            creds.refresh(self._refresh_request)
+            self._save_credentials(creds)
+            logger.info(f"Proactively refreshed Gmail token for {self.account_email}")
+        except Exception as e:
+            logger.warning(f"Background token refresh failed: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refresh_in_flight = False
+    
     def _create_credentials_file(self):
         """Create credentials.json file from environment variables."""
         credentials_data = {
@@ -273,8 +532,21 @@ class GmailClient:
                 "redirect_uris": [self.redirect_uri],
             }
         }
-        with open(self.credentials_file, 'w') as f:
-            json.dump(credentials_data, f, indent=2)
+        content = json.dumps(credentials_data, indent=2).encode('utf-8')
+        
+        # Skip the write if the file already holds this content (e.g. written by another worker)
+        try:
+            with open(self.credentials_file, 'rb') as f:
+                if f.read() == content:
+                    return
+        except FileNotFoundError:
+            pass
+        
+        # Write atomically so a concurrent reader never sees a torn file
+        creds_dir = os.path.dirname(os.path.abspath(self.credentials_file))
+        with tempfile.NamedTemporaryFile('wb', dir=creds_dir, delete=False, suffix='.tmp') as tmp:
+            tmp.write(content)
+        os.replace(tmp.name, self.credentials_file)
     
     def reset(self):
         """
@@ -284,14 +556,123 @@ class GmailClient:
         logger.info("Resetting Gmail client state")
         self.service = None
         self.credentials = None
+        self._cached_profile_email = None
+        self._cached_profile_ts = 0
+        with self._parse_cache_lock:
+            self._parse_cache.clear()
+    
+    def _get_profile_email(self, service) -> str:
+        """Get the authenticated account's email address, cached for PROFILE_CACHE_TTL."""
+        if self._cached_profile_email and time.time() - self._cached_profile_ts < PROFILE_CACHE_TTL:
+            return self._cached_profile_email
+        profile = service.users().getProfile(userId='me').execute(http=self._get_http(), num_retries=GMAIL_NUM_RETRIES)
+        self._cached_profile_email = profile['emailAddress']
+        self._cached_profile_ts = time.time()
+        return self._cached_profile_email
     
     def _get_service(self):
         """Get Gmail API service instance."""
         if not self.service:
             self.credentials = self._get_credentials()
-            self.service = build('gmail', 'v1', credentials=self.credentials)
+            # Use the discovery document bundled with google-api-python-client instead of
+            # fetching it over HTTPS on every build
+            self.service = build(
+                'gmail', 'v1',
+                credentials=self.credentials,
+                static_discovery=True,
+                cache_discovery=False
+            )
+        else:
+            self._refresh_if_expiring()
         return self.service
     
+    def _get_http(self) -> 'AuthorizedHttp':
+        """
+        Get this thread's authorized HTTP connection for executing Gmail requests.
+        
+        httplib2 isn't thread-safe, and the async manager methods call a client from
+        worker threads while other requests may use it on the event loop thread, so
+        requests never go through the service's shared connection. Call after
+        _get_service (a new one is made when the credentials change).
+        """
+        http = getattr(self._thread_local, 'http', None)
+        if http is None or http.credentials is not self.credentials:
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+    
+    def _batch_execute(self, service, requests: List[Tuple[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Execute Gmail API requests as multipart batch calls.
+        
+        Args:
+            service: Gmail API service instance
+            requests: List of (item_id, HttpRequest) pairs; item_id is used for logging
+        
+        Sub-requests rejected with 429 or 5xx are re-batched with jittered exponential
+        backoff, up to GMAIL_NUM_RETRIES times.
+        
+        Returns:
+            Responses in the same order as requests (None for sub-requests that failed)
+        """
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        # index -> error for sub-requests that failed in the current round
+        failures: Dict[int, Exception] = {}
+        
+        def collect(request_id, response, exception):
+            index = int(request_id)
+            if exception is not None:
+                failures[index] = exception
+                return
+            responses[index] = response
+        
+        def run_batch(indices: List[int], http=None):
+            batch = service.new_batch_http_request(callback=collect)
+            for index in indices:
+                batch.add(requests[index][1], request_id=str(index))
+            batch.execute(http=http)
+        
+        pending = list(range(len(requests)))
+        for attempt in range(GMAIL_NUM_RETRIES + 1):
+            failures.clear()
+            chunks = [pending[i:i + GMAIL_BATCH_SIZE] for i in range(0, len(pending), GMAIL_BATCH_SIZE)]
+            if len(chunks) <= 1:
+                for chunk in chunks:
+                    run_batch(chunk, self._get_http())
+            else:
+                # httplib2 isn't thread-safe, so each parallel batch call gets its own
+                # authorized connection (sharing the credentials object)
+                with ThreadPoolExecutor(max_workers=min(GMAIL_BATCH_MAX_WORKERS, len(chunks))) as executor:
+                    futures = [
+                        executor.submit(run_batch, chunk, AuthorizedHttp(self.credentials, http=httplib2.Http()))
+                        for chunk in chunks
+                    ]
+                    for future in futures:
+                        future.result()
+            
+            retryable = sorted(
+                index for index, error in failures.items()
+                if isinstance(error, HttpError) and (error.resp.status == 429 or error.resp.status >= 500)
+            )
+            if not retryable or attempt == GMAIL_NUM_RETRIES:
+                for index, error in sorted(failures.items()):
+                    logger.warning(f"Error fetching {requests[index][0]}: {error}")
+                break
+            
+            wait_time = random.uniform(0, min(GMAIL_RETRY_MAX_DELAY, GMAIL_RETRY_BASE_DELAY * 2 ** attempt))
+            logger.warning(
+                f"Retrying {len(retryable)} rate-limited/failed Gmail requests "
+                f"({attempt + 1}/{GMAIL_NUM_RETRIES}) after {wait_time:.2f}s"
+            )
+            retry_set = set(retryable)
+            for index, error in sorted(failures.items()):
+                if index not in retry_set:
+                    logger.warning(f"Error fetching {requests[index][0]}: {error}")
+            time.sleep(wait_time)
+            pending = retryable
+        
+        return responses
+    
     def send_email(
         self,
         to_address: str,
@@ -316,51 +697,17 @@ class GmailClient:
             
             # Get user's email if not provided
             if not from_address:
-                profile = service.users().getProfile(userId='me').execute()
-                from_address = profile['emailAddress']
-            
-            # Create HTML email with proper styling to ensure full-width display in Gmail
-            # Convert plain text line breaks to HTML
-            html_body = body.replace('\n', '<br>')
-            
-            # Create multipart message with both plain text and HTML
-            message = MIMEMultipart('alternative')
-            message['to'] = to_address
-            message['from'] = from_address
-            message['subject'] = subject
-            
-            # Add plain text version
-            text_part = MIMEText(body, 'plain')
-            message.attach(text_part)
+                from_address = self._get_profile_email(service)
             
-            # Add HTML version with full-width styling
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="UTF-8">
-            </head>
-            <body style="margin: 0; padding: 0; font-family: Arial, sans-serif; font-size: 14px; line-height: 1.6; color: #333; max-width: 100%; width: 100%;">
-                <div style="max-width: 100%; width: 100%; padding: 20px;">
-                    {html_body}
-                </div>
-            </body>
-            </html>
-            """
-            html_part = MIMEText(html_content, 'html')
-            message.attach(html_part)
-            
-            # Add X-CRM-Sent header to identify CRM-sent emails
-            message['X-CRM-Sent'] = 'true'
-            
-            # Encode message
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
+            # Plain text + full-width HTML message, tagged with X-CRM-Sent to identify CRM-sent emails
+            raw_bytes = _build_raw_message(to_address, from_address, subject, body)
+            raw_message = base64.urlsafe_b64encode(raw_bytes).decode('ascii')
             
             # Send message
             send_result = service.users().messages().send(
                 userId='me',
                 body={'raw': raw_message}
-            ).execute()
+            ).execute(http=self._get_http())
             
             message_id = send_result.get('id')
             thread_id = send_result.get('threadId')
@@ -393,8 +740,7 @@ class GmailClient:
         """Get the email address for this account."""
         try:
             service = self._get_service()
-            profile = service.users().getProfile(userId='me').execute()
-            return profile['emailAddress']
+            return self._get_profile_email(service)
         except Exception as e:
             logger.warning(f"Could not get account email: {e}")
             return self.account_email
@@ -435,39 +781,44 @@ class GmailClient:
                 query_params['q'] = base_query
             
             # List messages
-            results = service.users().messages().list(**query_params).execute()
+            results = service.users().messages().list(**query_params).execute(http=self._get_http(), num_retries=GMAIL_NUM_RETRIES)
             messages = results.get('messages', [])
             
-            # Get full message details
-            full_messages = []
-            for msg in messages:
-                try:
-                    full_msg = service.users().messages().get(
-                        userId='me',
-                        id=msg['id'],
-                        format='full'
-                    ).execute()
-                    
-                    # Filter for CRM-sent emails if requested
-                    if crm_sent_only:
-                        headers = full_msg.get('payload', {}).get('headers', [])
-                        has_crm_header = any(
-                            h.get('name', '').lower() == 'x-crm-sent' 
-                            for h in headers
+            # Filter for CRM-sent emails if requested, using header-only metadata
+            # fetches so full bodies are only downloaded for messages that match
+            if crm_sent_only:
+                metadata = self._batch_execute(service, [
+                    (
+                        f"message {msg['id']}",
+                        service.users().messages().get(
+                            userId='me',
+                            id=msg['id'],
+                            format='metadata',
+                            metadataHeaders=['X-CRM-Sent']
                         )
-                        if not has_crm_header:
-                            continue
-                    
-                    full_messages.append(full_msg)
-                    
-                    # Stop if we have enough filtered results
-                    if len(full_messages) >= max_results:
-                        break
-                except Exception as e:
-                    logger.warning(f"Error fetching message {msg['id']}: {e}")
-                    continue
+                    )
+                    for msg in messages
+                ])
+                crm_messages = []
+                for msg, meta in zip(messages, metadata):
+                    if meta is None:
+                        continue
+                    if _has_crm_header(meta.get('payload', {}).get('headers', [])):
+                        crm_messages.append(msg)
+                # Stop once we have enough filtered results
+                messages = crm_messages[:max_results]
+            
+            # Get full message details in batched round-trips
+            fetched = self._batch_execute(service, [
+                (
+                    f"message {msg['id']}",
+                    service.users().messages().get(userId='me', id=msg['id'], format='full')
+                )
+                for msg in messages
+            ])
             
-            return full_messages
+            full_messages = [full_msg for full_msg in fetched if full_msg is not None]
+            return full_messages[:max_results]
         except HttpError as error:
             logger.error(f"Gmail API error fetching messages: {error}")
             raise Exception(f"Failed to fetch messages: {error}")
@@ -496,38 +847,31 @@ class GmailClient:
         try:
             service = self._get_service()
             
-            # Get messages from these threads
-            all_messages = []
-            for thread_id in thread_ids[:10]:  # Limit to avoid too many API calls
-                try:
-                    thread = service.users().threads().get(
-                        userId='me',
-                        id=thread_id,
-                        format='full'
-                    ).execute()
-                    
-                    messages = thread.get('messages', [])
-                    for msg in messages:
-                        # Check if this is a reply (not the original sent message)
-                        headers = msg.get('payload', {}).get('headers', [])
-                        has_crm_header = any(
-                            h.get('name', '').lower() == 'x-crm-sent' 
-                            for h in headers
-                        )
-                        # Only include if it's NOT a CRM-sent message (i.e., it's a response)
-                        if not has_crm_header:
-                            all_messages.append(msg)
-                except Exception as e:
-                    logger.warning(f"Error fetching thread {thread_id}: {e}")
+            # Get messages from these threads in one batched round-trip
+            threads = self._batch_execute(service, [
+                (
+                    f"thread {thread_id}",
+                    service.users().threads().get(userId='me', id=thread_id, format='full')
+                )
+                for thread_id in thread_ids[:10]  # Limit to avoid too many API calls
+            ])
+            
+            # (internalDate as int, message) pairs, so the date is parsed once per message
+            dated_messages = []
+            for thread in threads:
+                if thread is None:
                     continue
+                
+                messages = thread.get('messages', [])
+                for msg in messages:
+                    # Only include if it's NOT a CRM-sent message (i.e., it's a response)
+                    if not _has_crm_header(msg.get('payload', {}).get('headers', [])):
+                        dated_messages.append((int(msg.get('internalDate', 0)), msg))
             
             # Sort by date (newest first) and limit
-            all_messages.sort(
-                key=lambda m: int(m.get('internalDate', 0)),
-                reverse=True
-            )
+            dated_messages.sort(key=operator.itemgetter(0), reverse=True)
             
-            return all_messages[:max_results]
+            return [msg for _, msg in dated_messages[:max_results]]
         except HttpError as error:
             logger.error(f"Gmail API error fetching responses: {error}")
             raise Exception(f"Failed to fetch responses: {error}")
@@ -545,92 +889,107 @@ class GmailClient:
         Returns:
             Dictionary with parsed message data
         """
+        # Gmail message IDs are immutable, so a message parsed before can be
+        # returned without re-decoding its body
+        message_id = gmail_message.get('id')
+        if message_id:
+            with self._parse_cache_lock:
+                cached = self._parse_cache.get(message_id)
+                if cached is not None:
+                    self._parse_cache.move_to_end(message_id)
+                    return dict(cached)
+        
         headers = gmail_message.get('payload', {}).get('headers', [])
         
-        def get_header(name: str) -> Optional[str]:
-            for header in headers:
-                if header['name'].lower() == name.lower():
-                    return header['value']
-            return None
+        # Build a lowercase header map once; reversed so the first occurrence wins
+        hmap = {h['name'].lower(): h['value'] for h in reversed(headers)}
         
         # Extract email addresses
-        from_address = get_header('From')
-        to_address = get_header('To')
-        subject = get_header('Subject')
+        from_address = hmap.get('from')
+        to_address = hmap.get('to')
+        subject = hmap.get('subject')
         
         # Extract body
         body = self._extract_body(gmail_message.get('payload', {}))
         
         # Extract dates
-        date_str = get_header('Date')
+        date_str = hmap.get('date')
         received_at = None
         if date_str:
             try:
-                from email.utils import parsedate_to_datetime
-                from datetime import timezone
                 received_at = parsedate_to_datetime(date_str)
-                # Convert to UTC if timezone-aware, otherwise assume UTC
-                if received_at.tzinfo is None:
-                    received_at = received_at.replace(tzinfo=timezone.utc)
-                else:
-                    received_at = received_at.astimezone(timezone.utc)
-                # Remove timezone for storage (we'll store as naive UTC)
-                received_at = received_at.replace(tzinfo=None)
+                # Store as naive UTC: naive dates are already assumed UTC, aware
+                # dates are converted unless they're already at UTC offset zero
+                if received_at.tzinfo is not None:
+                    if received_at.utcoffset():
+                        received_at = received_at.astimezone(timezone.utc)
+                    received_at = received_at.replace(tzinfo=None)
             except Exception as e:
                 logger.warning(f"Error parsing date {date_str}: {e}")
-                received_at = datetime.utcnow()
+                received_at = _utcnow()
         
-        return {
-            'provider_message_id': gmail_message.get('id'),
+        parsed = {
+            'provider_message_id': message_id,
             'thread_id': gmail_message.get('threadId'),
             'from_address': from_address,
             'to_address': to_address,
             'subject': subject,
             'body': body,
-            'received_at': received_at or datetime.utcnow()
+            'received_at': received_at or _utcnow()
         }
+        
+        if message_id:
+            with self._parse_cache_lock:
+                self._parse_cache[message_id] = parsed
+                if len(self._parse_cache) > PARSE_CACHE_MAXSIZE:
+                    self._parse_cache.popitem(last=False)
+            return dict(parsed)
+        return parsed
     
     def _extract_body(self, payload: Dict[str, Any]) -> str:
         """Extract text body from Gmail message payload."""
         body = ""
         
         # Check if body is directly in payload
-        if 'body' in payload and 'data' in payload['body']:
+        body_data = payload.get('body', {}).get('data')
+        if body_data:
             try:
-                body_data = payload['body']['data']
                 body = base64.urlsafe_b64decode(body_data).decode('utf-8')
-            except:
-                pass
+            except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+                logger.debug(f"Body decode failed: {e}")
         
         # Check parts (for multipart messages)
-        if 'parts' in payload:
-            for part in payload['parts']:
-                if part.get('mimeType') == 'text/plain':
-                    if 'body' in part and 'data' in part['body']:
-                        try:
-                            body_data = part['body']['data']
-                            body = base64.urlsafe_b64decode(body_data).decode('utf-8')
-                            break
-                        except:
-                            pass
-                elif part.get('mimeType') == 'text/html' and not body:
-                    # Fallback to HTML if no plain text
-                    if 'body' in part and 'data' in part['body']:
-                        try:
-                            body_data = part['body']['data']
-                            body = base64.urlsafe_b64decode(body_data).decode('utf-8')
-                            # Strip HTML tags (basic)
-                            import re
-                            body = re.sub(r'<[^>]+>', '', body)
-                            break
-                        except:
-                            pass
+        for part in payload.get('parts', []):
+            mime_type = part.get('mimeType')
+            if mime_type != 'text/plain' and (mime_type != 'text/html' or body):
+                continue
+            body_data = part.get('body', {}).get('data')
+            if not body_data:
+                continue
+            
+            try:
+                raw = base64.urlsafe_b64decode(body_data)
+                if mime_type == 'text/plain':
+                    body = raw.decode('utf-8')
+                else:
+                    # Fallback to HTML if no plain text: strip tags (basic) on the raw bytes, then decode once
+                    body = _HTML_TAG_RE.sub(b'', raw).decode('utf-8', errors='replace')
+                break
+            except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+                logger.debug(f"Body part decode failed: {e}")
         
         return body or "(No body content)"
 
 
 class MultiAccountGmailManager:
-    """Manager for multiple Gmail accounts."""
+    """
+    Manager for multiple Gmail accounts.
+    
+    Gmail batch requests are authorized with a single account's OAuth token, so
+    requests can't be batched across accounts; each client batches its own
+    fetches (see GmailClient._batch_execute) and the async methods run accounts
+    concurrently instead.
+    """
     
     def __init__(
         self,
@@ -663,18 +1022,40 @@ class MultiAccountGmailManager:
             else:
                 self.account_emails = []
         
-        # Initialize clients for each account
+        # One pooled session for every account's token refreshes, so refreshes
+        # reuse connections to the OAuth endpoint instead of each opening their own
+        self._shared_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self._shared_session.mount('https://', adapter)
+        
+        # Clients are created on first use (see get_client); at most one per configured account
         self.clients: Dict[str, GmailClient] = {}
-        for email in self.account_emails:
-            try:
-                self.clients[email] = GmailClient(
-                    client_id=self.client_id,
-                    client_secret=self.client_secret,
-                    redirect_uri=self.redirect_uri,
-                    account_email=email
-                )
-            except Exception as e:
-                logger.warning(f"Could not initialize Gmail client for {email}: {e}")
+        self._clients_lock = threading.Lock()
+        # Caps concurrent Gmail calls in the async methods to stay under per-user quotas
+        self._sem = asyncio.Semaphore(GMAIL_MAX_CONCURRENCY)
+    
+    def _create_client(self, account_email: str) -> Optional[GmailClient]:
+        """Get the client for a configured account, creating it on first use."""
+        client = self.clients.get(account_email)
+        if client is not None:
+            return client
+        
+        with self._clients_lock:
+            client = self.clients.get(account_email)
+            if client is None:
+                try:
+                    client = GmailClient(
+                        client_id=self.client_id,
+                        client_secret=self.client_secret,
+                        redirect_uri=self.redirect_uri,
+                        account_email=account_email,
+                        session=self._shared_session
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not initialize Gmail client for {account_email}: {e}")
+                    return None
+                self.clients[account_email] = client
+        return client
     
     def get_client(self, account_email: Optional[str] = None) -> Optional[GmailClient]:
         """
@@ -687,10 +1068,15 @@ class MultiAccountGmailManager:
             GmailClient instance or None
         """
         if account_email:
-            return self.clients.get(account_email)
-        elif self.clients:
-            # Return first available client
-            return next(iter(self.clients.values()))
+            if account_email not in self.account_emails:
+                return None
+            return self._create_client(account_email)
+        
+        # Return first available client
+        for email in self.account_emails:
+            client = self._create_client(email)
+            if client:
+                return client
         return None
     
     def reset(self, account_email: Optional[str] = None):
@@ -706,8 +1092,10 @@ class MultiAccountGmailManager:
                 client.reset()
                 logger.info(f"Reset Gmail client for account: {account_email}")
         else:
-            # Reset all clients
-            for email, client in self.clients.items():
+            # Reset all clients (accounts not used yet have no state to reset)
+            with self._clients_lock:
+                clients = list(self.clients.items())
+            for email, client in clients:
                 try:
                     client.reset()
                     logger.info(f"Reset Gmail client for account: {email}")
@@ -716,7 +1104,22 @@ class MultiAccountGmailManager:
     
     def get_all_accounts(self) -> List[str]:
         """Get list of all configured account emails."""
-        return list(self.clients.keys())
+        return list(self.account_emails)
+    
+    def _account_clients(self, account_email: Optional[str] = None) -> List[Tuple[str, GmailClient]]:
+        """
+        (email, client) pairs for one account or all configured accounts.
+        
+        Already-created clients are read straight from self.clients; accounts whose
+        client can't be initialized are skipped.
+        """
+        emails = [account_email] if account_email else self.account_emails
+        pairs = []
+        for email in emails:
+            client = self.clients.get(email) or self.get_client(email)
+            if client:
+                pairs.append((email, client))
+        return pairs
     
     def send_email(
         self,
@@ -762,32 +1165,85 @@ class MultiAccountGmailManager:
         """
         all_messages = []
         
-        accounts_to_query = [account_email] if account_email else self.get_all_accounts()
-        
-        for email in accounts_to_query:
-            client = self.get_client(email)
-            if not client:
-                continue
-            
+        for email, client in self._account_clients(account_email):
             try:
                 messages = client.get_recent_messages(
                     max_results=max_results,
                     crm_sent_only=True
                 )
-                # Add account email to each message
-                for msg in messages:
-                    msg['_account_email'] = email
+                _stamp_account(messages, email)
                 all_messages.extend(messages)
             except Exception as e:
                 logger.warning(f"Error fetching CRM-sent emails from {email}: {e}")
         
-        # Sort by date (newest first)
-        all_messages.sort(
-            key=lambda m: int(m.get('internalDate', 0)),
-            reverse=True
+        # Newest first, limited to max_results
+        return _newest_first(all_messages, max_results)
+    
+    async def _run_limited(self, func, *args, **kwargs):
+        """Run a blocking Gmail call in a worker thread, at most GMAIL_MAX_CONCURRENCY at once."""
+        async with self._sem:
+            return await asyncio.to_thread(func, *args, **kwargs)
+    
+    async def aget_crm_sent_emails(
+        self,
+        max_results: int = 50,
+        account_email: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Async get_crm_sent_emails: queries all accounts concurrently.
+        
+        Each account's blocking Gmail calls run in a worker thread, so total latency
+        is roughly that of the slowest account rather than the sum.
+        """
+        clients = self._account_clients(account_email)
+        
+        results = await asyncio.gather(
+            *(
+                self._run_limited(client.get_recent_messages, max_results=max_results, crm_sent_only=True)
+                for _, client in clients
+            ),
+            return_exceptions=True
         )
         
-        return all_messages[:max_results]
+        all_messages = []
+        for (email, _), messages in zip(clients, results):
+            if isinstance(messages, Exception):
+                logger.warning(f"Error fetching CRM-sent emails from {email}: {messages}")
+                continue
+            _stamp_account(messages, email)
+            all_messages.extend(messages)
+        
+        # Newest first, limited to max_results
+        return _newest_first(all_messages, max_results)
+    
+    async def stream_crm_sent_emails(
+        self,
+        max_results: int = 50,
+        account_email: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield CRM-sent emails account by account as each account's fetch completes.
+        
+        Messages are newest first within each account but not across accounts; use
+        aget_crm_sent_emails for a single date-ordered list. The first messages are
+        available after the fastest account responds instead of the slowest.
+        
+        Args:
+            max_results: Maximum results per account
+            account_email: Specific account to query (None for all accounts)
+        """
+        async def fetch(email: str, client: GmailClient):
+            try:
+                return email, await self._run_limited(client.get_recent_messages, max_results=max_results, crm_sent_only=True)
+            except Exception as e:
+                logger.warning(f"Error fetching CRM-sent emails from {email}: {e}")
+                return email, []
+        
+        for next_result in asyncio.as_completed([fetch(email, client) for email, client in self._account_clients(account_email)]):
+            email, messages = await next_result
+            _stamp_account(messages, email)
+            for msg in _newest_first(messages, len(messages)):
+                yield msg
     
     def get_crm_responses(
         self,
@@ -806,20 +1262,54 @@ class MultiAccountGmailManager:
         """
         all_responses = []
         
-        for email, client in self.clients.items():
+        for email, client in self._account_clients():
             try:
                 responses = client.get_responses_to_crm_emails(thread_ids, max_results)
-                # Add account email to each response
-                for msg in responses:
-                    msg['_account_email'] = email
+                _stamp_account(responses, email)
                 all_responses.extend(responses)
             except Exception as e:
                 logger.warning(f"Error fetching responses from {email}: {e}")
         
-        # Sort by date (newest first)
-        all_responses.sort(
-            key=lambda m: int(m.get('internalDate', 0)),
-            reverse=True
-        )
+        # Newest first, limited to max_results
+        return _newest_first(all_responses, max_results)
+    
+    async def aget_crm_responses(
+        self,
+        thread_ids: List[str],
+        max_results: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Async get_crm_responses: queries all accounts concurrently.
+        
+        Each account's blocking Gmail calls run in a worker thread. Results are folded
+        into a bounded heap as each account finishes, so only the newest max_results
+        responses are kept in memory.
+        """
+        if max_results <= 0:
+            return []
+        
+        async def fetch(email: str, client: GmailClient):
+            try:
+                return email, await self._run_limited(client.get_responses_to_crm_emails, thread_ids, max_results)
+            except Exception as e:
+                logger.warning(f"Error fetching responses from {email}: {e}")
+                return email, []
+        
+        # Min-heap of (internalDate, sequence, message); the sequence breaks date ties
+        # so messages themselves are never compared
+        newest: List[Tuple[int, int, Dict[str, Any]]] = []
+        sequence = 0
+        for next_result in asyncio.as_completed([fetch(email, client) for email, client in self._account_clients()]):
+            email, responses = await next_result
+            _stamp_account(responses, email)
+            for msg in responses:
+                entry = (msg['_ts'], sequence, msg)
+                sequence += 1
+                if len(newest) < max_results:
+                    heapq.heappush(newest, entry)
+                elif entry[0] > newest[0][0]:
+                    heapq.heapreplace(newest, entry)
         
-        return all_responses[:max_results]
+        # Newest first
+        newest.sort(key=operator.itemgetter(0, 1), reverse=True)
+        return [msg for _, _, msg in newest]
@@ -3,20 +3,49 @@ Twilio SMS integration client.
 
 Handles SMS sending and receiving via Twilio API.
 """
+import asyncio
+import functools
 import os
-from typing import Optional, Dict, Any
-from datetime import datetime
+import random
+import re
+from typing import Optional, Dict, Any, List, Tuple, Union
+from datetime import datetime, timezone
 import logging
 
 try:
     from twilio.rest import Client as TwilioClient
-    from twilio.base.exceptions import TwilioException
+    from twilio.base.exceptions import TwilioException, TwilioRestException
 except ImportError:
     # Will be caught during initialization
     pass
 
 logger = logging.getLogger(__name__)
 
+# E.164: '+', a non-zero country code digit, up to 15 digits total (use with fullmatch)
+_E164_RE = re.compile(r'\+[1-9][0-9]{6,14}')
+
+# Everything normalize_phone_number strips (anything but ASCII digits and '+')
+_NON_PHONE_CHARS_RE = re.compile(r'[^0-9+]')
+
+# Max SMS sends in flight at once in send_sms_bulk
+TWILIO_MAX_CONCURRENCY = 20
+
+# Retries for sends rejected with 429, with jittered exponential backoff (seconds)
+TWILIO_MAX_RETRIES = 3
+BASE_DELAY = 1.0
+MAX_DELAY = 30.0
+
+
+@functools.lru_cache(maxsize=8)
+def _get_twilio_client(account_sid: str, auth_token: str) -> 'TwilioClient':
+    """
+    Get a Twilio REST client for the given credentials.
+    
+    Cached so every TwilioSMSClient for the same account shares one client (and its
+    HTTP connection pool) instead of opening new connections each time.
+    """
+    return TwilioClient(account_sid, auth_token)
+
 
 class TwilioSMSClient:
     """Client for Twilio SMS operations."""
@@ -59,7 +88,7 @@ class TwilioSMSClient:
             )
         
         try:
-            self.client = TwilioClient(self.account_sid, self.auth_token)
+            self.client = _get_twilio_client(self.account_sid, self.auth_token)
         except Exception as e:
             logger.error(f"Error initializing Twilio client: {e}")
             raise
@@ -88,13 +117,7 @@ class TwilioSMSClient:
             
             logger.info(f"SMS sent successfully. Message SID: {message.sid}")
             
-            return {
-                'message_sid': message.sid,
-                'status': message.status,
-                'from_phone': self.from_number,
-                'to_phone': to_phone,
-                'date_sent': message.date_sent
-            }
+            return self._message_result(message, to_phone)
         except TwilioException as e:
             logger.error(f"Twilio API error sending SMS: {e}")
             raise Exception(f"Failed to send SMS: {e}")
@@ -102,6 +125,63 @@ class TwilioSMSClient:
             logger.error(f"Error sending SMS: {e}")
             raise
     
+    def _message_result(self, message, to_phone: str) -> Dict[str, Any]:
+        """Build the send result dictionary for a created Twilio message."""
+        return {
+            'message_sid': message.sid,
+            'status': message.status,
+            'from_phone': self.from_number,
+            'to_phone': to_phone,
+            'date_sent': message.date_sent
+        }
+    
+    async def send_sms_bulk(
+        self,
+        messages: List[Tuple[str, str]]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Send many SMS concurrently.
+        
+        Up to TWILIO_MAX_CONCURRENCY sends run at once (each in a worker thread, since
+        the Twilio SDK is blocking). Sends rejected with 429 are retried with jittered
+        exponential backoff.
+        
+        Args:
+            messages: List of (to_phone, body) pairs
+        
+        Returns:
+            One entry per message, in order: the send_sms result dictionary, or the
+            exception if that send failed
+        """
+        semaphore = asyncio.Semaphore(TWILIO_MAX_CONCURRENCY)
+        
+        async def send_one(to_phone: str, body: str) -> Dict[str, Any]:
+            async with semaphore:
+                for attempt in range(TWILIO_MAX_RETRIES + 1):
+                    try:
+                        message = await asyncio.to_thread(
+                            self.client.messages.create,
+                            body=body,
+                            from_=self.from_number,
+                            to=to_phone
+                        )
+                        return self._message_result(message, to_phone)
+                    except TwilioRestException as e:
+                        if e.status != 429 or attempt == TWILIO_MAX_RETRIES:
+                            logger.error(f"Twilio API error sending SMS to {to_phone}: {e}")
+                            raise
+                        delay = random.uniform(0, min(MAX_DELAY, BASE_DELAY * 2 ** attempt))
+                        logger.warning(f"Twilio rate limited sending to {to_phone}, retrying in {delay:.1f}s")
+                        await asyncio.sleep(delay)
+        
+        results = await asyncio.gather(
+            *(send_one(to_phone, body) for to_phone, body in messages),
+            return_exceptions=True
+        )
+        sent = sum(1 for result in results if not isinstance(result, Exception))
+        logger.info(f"Bulk SMS: {sent}/{len(messages)} sent successfully")
+        return results
+    
     def parse_inbound_webhook(self, webhook_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse Twilio webhook data into our message format.
@@ -117,7 +197,9 @@ class TwilioSMSClient:
             'from_phone': webhook_data.get('From'),
             'to_phone': webhook_data.get('To'),
             'body': webhook_data.get('Body', ''),
-            'received_at': datetime.utcnow()  # Twilio provides timestamp, but we'll use current time
+            # The inbound webhook carries no timestamp, so use the time it arrived
+            # (naive UTC, like the Gmail integration's timestamps)
+            'received_at': datetime.now(timezone.utc).replace(tzinfo=None)
         }
     
     def validate_phone_number(self, phone: str) -> bool:
@@ -130,16 +212,8 @@ class TwilioSMSClient:
         Returns:
             True if valid format
         """
-        # Basic E.164 format check: starts with +, followed by digits
-        if not phone:
-            return False
-        if not phone.startswith('+'):
-            return False
-        if len(phone) < 8 or len(phone) > 15:  # E.164 max length
-            return False
-        if not phone[1:].isdigit():
-            return False
-        return True
+        # E.164 format check: +, then 7-15 digits with no leading zero
+        return bool(phone) and _E164_RE.fullmatch(phone) is not None
     
     def normalize_phone_number(self, phone: str) -> Optional[str]:
         """
@@ -156,8 +230,12 @@ class TwilioSMSClient:
         if not phone:
             return None
         
+        # Already valid E.164 (the common case for stored numbers): nothing to clean up
+        if _E164_RE.fullmatch(phone):
+            return phone
+        
         # Remove all non-digit characters except +
-        normalized = ''.join(c for c in phone if c.isdigit() or c == '+')
+        normalized = _NON_PHONE_CHARS_RE.sub('', phone)
         
         # If doesn't start with +, try to add country code (US default: +1)
         if not normalized.startswith('+'):
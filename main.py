@@ -3,22 +3,36 @@ Main entry point for the Contact Management API server.
 """
 import uvicorn
 import os
+import sys
 from dotenv import load_dotenv
 from pathlib import Path
 
-# Load environment variables
+# Load environment variables in local development; deployed environments
+# (CONTACTS_ENV set to anything else) get them from the orchestrator
 # Use explicit path to ensure .env is found regardless of working directory
-env_path = Path(__file__).parent / ".env"
-load_dotenv(dotenv_path=env_path)
+IS_DEV = os.getenv("CONTACTS_ENV", "dev") == "dev"
+if IS_DEV:
+    env_path = Path(__file__).parent / ".env"
+    load_dotenv(dotenv_path=env_path)
 
 if __name__ == "__main__":
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", 8000))
+    # Auto-reload on code changes by default only in development
+    reload = os.getenv("UVICORN_RELOAD", "1" if IS_DEV else "0") == "1"
+    # reload and multiple workers are mutually exclusive
+    workers = 1 if reload else int(os.getenv("UVICORN_WORKERS", "1"))
     
     uvicorn.run(
         "contacts.api:app",
         host=host,
         port=port,
-        reload=True,  # Auto-reload on code changes
+        reload=reload,
+        workers=workers,
+        # Require the C event loop and HTTP parser so a missing install fails at startup
+        # instead of silently falling back; uvloop is only installed off Windows
+        # (same condition as its requirements.txt marker)
+        loop="uvloop" if sys.platform != "win32" else "auto",
+        http="httptools",
         log_level="info"
     )
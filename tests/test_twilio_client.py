@@ -0,0 +1,37 @@
+"""
+Tests for Twilio phone number validation and normalization.
+
+Run with: python -m unittest discover tests
+"""
+import unittest
+
+from integrations.sms.twilio_client import TwilioSMSClient
+
+
+class PhoneNumberTests(unittest.TestCase):
+    def setUp(self):
+        # The phone helpers don't touch Twilio, so skip __init__ (which needs credentials)
+        self.client = TwilioSMSClient.__new__(TwilioSMSClient)
+    
+    def test_validate_accepts_e164(self):
+        self.assertTrue(self.client.validate_phone_number('+15551234567'))
+    
+    def test_validate_rejects_surrounding_whitespace(self):
+        for phone in ('+15551234567\n', '+15551234567 ', ' +15551234567', '+15551234567\r\n'):
+            with self.subTest(phone=phone):
+                self.assertFalse(self.client.validate_phone_number(phone))
+    
+    def test_normalize_returns_e164_unchanged(self):
+        self.assertEqual(self.client.normalize_phone_number('+15551234567'), '+15551234567')
+    
+    def test_normalize_strips_whitespace_and_newlines(self):
+        for phone in ('+15551234567\n', '+15551234567 ', ' +15551234567', '+15551234567\r\n', '\t+1 555 123 4567\n'):
+            with self.subTest(phone=phone):
+                self.assertEqual(self.client.normalize_phone_number(phone), '+15551234567')
+    
+    def test_normalize_formats_us_numbers(self):
+        self.assertEqual(self.client.normalize_phone_number('(555) 123-4567\n'), '+15551234567')
+
+
+if __name__ == '__main__':
+    unittest.main()